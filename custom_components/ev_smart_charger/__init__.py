@@ -99,6 +99,7 @@ async def _async_cleanup_partial_setup(runtime_data: EVSCRuntimeData) -> None:
         ("diagnostic_manager", "Diagnostic Manager"),
         ("log_manager", "Log Manager"),
         ("ev_soc_monitor", "EV SOC Monitor"),
+        ("charger_controller", "Charger Controller"),
     ]
 
     for attr_name, label in cleanup_order:
@@ -137,11 +138,10 @@ def _collect_disabled_helper_keys(hass: HomeAssistant, entry_id: str) -> list[st
     ``async_added_to_hass`` for all of these, so they all break the
     registration barrier in the same way.
     """
-    ent_reg = er.async_get(hass)
     disabled_keys: list[str] = []
-    for registry_entry in ent_reg.entities.values():
-        if registry_entry.config_entry_id != entry_id:
-            continue
+    for registry_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry_id
+    ):
         if registry_entry.disabled_by is None:
             continue
         key = _entity_key_from_unique_id(registry_entry.unique_id, entry_id)
@@ -711,7 +711,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     charger_controller = runtime_data.charger_controller
     if charger_controller:
         _LOGGER.info("🗑️  Removing Charger Controller")
-        # ChargerController doesn't need explicit cleanup, just logging
+        await charger_controller.async_remove()
 
     # Unload platforms
     _LOGGER.info("🗑️  Unloading platforms")
@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import count
 import re
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-import async_timeout
 from homeassistant.util import dt as dt_util
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     CHARGER_AMPERAGE_STABILIZATION_DELAY,
@@ -17,9 +20,11 @@ from .const import (
     CHARGER_MIN_OPERATION_INTERVAL,
     CHARGER_MODEL_TUYA,
     CHARGER_START_SEQUENCE_DELAY,
+    CHARGER_STATE_ECHO_WINDOW,
     CHARGER_STOP_SEQUENCE_DELAY,
     CONF_EV_CHARGER_CURRENT,
     CONF_EV_CHARGER_SWITCH,
+    DOMAIN,
     SERVICE_CALL_TIMEOUT,
     get_amp_levels,
     get_charger_model,
@@ -29,6 +34,42 @@ from .utils.amperage_helper import AmperageCalculator
 from .utils.logging_helper import EVSCLogger
 
 
+_ENTITY_LOCKS_KEY = "_charger_entity_locks"
+
+
+def _get_entity_lock(
+    hass: HomeAssistant, entity_id: str, owner: ChargerController
+) -> asyncio.Lock:
+    """Return the lock serializing service calls against one charger entity.
+
+    Shared through hass.data so controllers of different config entries that
+    drive the same physical charger never have two calls in flight against
+    it. The lookup has no await, so get-then-set cannot race on the loop.
+    ``owner`` is recorded so _release_entity_locks() can drop unused locks.
+    """
+    locks = hass.data.setdefault(DOMAIN, {}).setdefault(_ENTITY_LOCKS_KEY, {})
+    entry = locks.get(entity_id)
+    if entry is None:
+        entry = locks[entity_id] = (asyncio.Lock(), set())
+    entry[1].add(owner)
+    return entry[0]
+
+
+def _release_entity_locks(hass: HomeAssistant, owner: ChargerController) -> None:
+    """Forget ``owner`` and drop entity locks no other controller uses."""
+    domain_data = hass.data.get(DOMAIN)
+    locks = domain_data.get(_ENTITY_LOCKS_KEY) if domain_data else None
+    if not locks:
+        return
+    for entity_id, (lock, owners) in list(locks.items()):
+        owners.discard(owner)
+        # A call still in flight keeps its lock until the next release
+        if not owners and not lock.locked():
+            del locks[entity_id]
+    if not locks:
+        del domain_data[_ENTITY_LOCKS_KEY]
+
+
 class CurrentControlAdapter:
     """Adapter for charger current entities across HA domains."""
 
@@ -66,7 +107,11 @@ class CurrentControlAdapter:
         if not self.entity_id:
             return None
 
-        state = self.hass.states.get(self.entity_id)
+        return self.parse_numeric_state(self.hass.states.get(self.entity_id))
+
+    @staticmethod
+    def parse_numeric_state(state: State | None) -> int | None:
+        """Parse an integer amperage from a current control entity state."""
         if state is None or state.state in (None, "unknown", "unavailable", "none"):
             return None
 
@@ -104,6 +149,13 @@ class CurrentControlAdapter:
         }
 
 
+_NO_REASON = "No reason provided"
+
+# Command slots for drop-stale coalescing: a request still waiting on the rate
+# limit is dropped once a newer request claims one of its slots.
+_SLOT_POWER = "power"
+_SLOT_AMPERAGE = "amperage"
+
 @dataclass
 class OperationResult:
     """Result of a charger operation with detailed feedback."""
@@ -149,24 +201,46 @@ class ChargerController:
         self.config = config
         self._runtime_data = runtime_data
         self.logger = EVSCLogger("CHARGER CONTROLLER")
+        # Monotonic event-loop clock for rate limiting and command timing.
+        self._loop = hass.loop
 
         self._charger_switch = config.get(CONF_EV_CHARGER_SWITCH)
         self._charger_current = config.get(CONF_EV_CHARGER_CURRENT)
         self._current_control = CurrentControlAdapter(hass, self._charger_current)
+        # Service payloads are immutable shapes: build them once and reuse
+        # (HA copies call data into the ServiceCall, so sharing is safe).
+        self._switch_payload = {"entity_id": self._charger_switch}
+        self._amperage_calls: dict[int, tuple[str, str, dict]] = {}
 
         # Charger model (v2.0.0): governs the amperage level set and whether the
         # safe stop/set/start decrease sequence is used (tuya) or a live set (generic).
         self._amp_levels = get_amp_levels(config)
         self._charger_model = get_charger_model(config)
+        # Precomputed for O(1) membership and bisect nearest-level lookup.
+        self._amp_level_set = frozenset(self._amp_levels)
+        self._sorted_amp_levels = tuple(sorted(self._amp_levels))
 
-        self._last_operation_time: Optional[datetime] = None
+        # Loop-clock deadline before which the next operation must wait
+        # (rate limiting); computed once when an operation completes.
+        self._next_operation_at: float = 0.0
         self._current_amperage: Optional[int] = None
         self._is_on: Optional[bool] = None
-        # v2.2.0 — measured charging power (W) cached on each _refresh_state.
+        # v2.2.0 — measured charging power (W) sampled for operation diagnostics.
         # None when no charging-power sensor is mapped (→ drawing-now falls back
         # to the commanded switch echo, byte-for-byte legacy behaviour).
         self._measured_power_w: Optional[float] = None
+        # Loop time of the last command we issued; a state change that diverges
+        # from the commanded value shortly after it is worth a warning.
+        self._last_command_time: Optional[float] = None
+        self._state_unsub = None
         self._lock = asyncio.Lock()
+        self._request_tickets = count(1)
+        self._slot_tickets: dict[str, int] = {}
+        # Requests currently inside _rate_limited_lock (waiting or running).
+        self._pending_requests = 0
+        # Replaced on every wake so each waiter sees exactly one broadcast.
+        self._wake = asyncio.Event()
+        self._shutdown = False
 
         self.logger.info(
             "Initialized ChargerController - Switch: %s, Current: %s, Model: %s",
@@ -189,6 +263,13 @@ class ChargerController:
         if self._runtime_data is None or self._runtime_data.diagnostic_manager is None:
             return
 
+        # Operations no longer re-read HA state, so sample the (diagnostic-only)
+        # measured power here, where it is actually reported.
+        if self._runtime_data.power_model is not None:
+            self._measured_power_w = self._runtime_data.power_model.read_charging_power(
+                self.hass
+            )
+
         await self._runtime_data.diagnostic_manager.async_emit_event(
             component="Charger Controller",
             event=operation,
@@ -199,6 +280,7 @@ class ChargerController:
                 "target_amps": target_amps,
                 "current_amps": self._current_amperage,
                 "charger_on": self._is_on,
+                "pending_requests": self._pending_requests,
                 # v2.2.0: measured charging power (diagnostic only — control uses
                 # the commanded switch echo). drawing_now is the model's stateless
                 # verdict; None when no power sensor is mapped.
@@ -220,12 +302,66 @@ class ChargerController:
         self.logger.info("Setting up ChargerController")
         await self._current_control.async_validate()
         await self._refresh_state()
+        # Single writer: we update the cache optimistically after our own
+        # commands, and this subscription corrects it on external changes.
+        self._state_unsub = async_track_state_change_event(
+            self.hass,
+            [self._charger_switch, self._charger_current],
+            self._async_charger_state_changed,
+        )
         self.logger.success(
             "Setup complete - Initial state: On=%s, Amperage=%sA",
             self._is_on,
             self._current_amperage,
         )
 
+    async def async_remove(self) -> None:
+        """Stop tracking charger entity state and release pending requests."""
+        if self._state_unsub:
+            self._state_unsub()
+            self._state_unsub = None
+
+        # Requests still waiting out the rate limit must not fire commands
+        # against an unloaded entry; wake them so they return immediately.
+        self._shutdown = True
+        self._wake_waiters()
+        _release_entity_locks(self.hass, self)
+
+        self.logger.info("Charger Controller removed")
+
+    @callback
+    def _async_charger_state_changed(self, event: Event) -> None:
+        """Reconcile the commanded-state cache with a charger entity change."""
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if new_state is None or (
+            old_state is not None and old_state.state == new_state.state
+        ):
+            return
+
+        if new_state.entity_id == self._charger_switch:
+            field, commanded, actual = "switch", self._is_on, new_state.state == "on"
+            self._is_on = actual
+        else:
+            actual = self._current_control.parse_numeric_state(new_state)
+            field, commanded = "amperage", self._current_amperage
+            self._current_amperage = actual
+
+        if (
+            commanded is not None
+            and actual != commanded
+            and self._last_command_time is not None
+            and self._loop.time() - self._last_command_time
+            < CHARGER_STATE_ECHO_WINDOW
+        ):
+            self.logger.warning(
+                "Charger %s changed to %s shortly after we commanded %s "
+                "- check the charger integration",
+                field,
+                actual,
+                commanded,
+            )
+
     async def _refresh_state(self):
         """Refresh cached state from Home Assistant.
 
@@ -234,10 +370,13 @@ class ChargerController:
         also caches the measured charging power for the operation DIAGNOSTIC only
         (it does not gate any control path); None when no power sensor is mapped.
         """
-        charger_state = self.hass.states.get(self._charger_switch)
+        states_get = self.hass.states.get
+        charger_state = states_get(self._charger_switch)
         if charger_state:
             self._is_on = charger_state.state == "on"
-        self._current_amperage = self._current_control.get_numeric_state()
+        self._current_amperage = self._current_control.parse_numeric_state(
+            states_get(self._charger_current) if self._charger_current else None
+        )
         if self._runtime_data is not None and self._runtime_data.power_model is not None:
             self._measured_power_w = self._runtime_data.power_model.read_charging_power(
                 self.hass
@@ -246,36 +385,42 @@ class ChargerController:
     async def start_charger(
         self,
         target_amps: Optional[int] = None,
-        reason: str = "",
+        reason: str = _NO_REASON,
     ) -> OperationResult:
         """Start the charger with optional target amperage."""
-        async with self._lock:
+        normalized_target = (
+            self._normalize_target_amps(target_amps) if target_amps is not None else None
+        )
+        async with self._rate_limited_lock(_SLOT_POWER) as current:
+            if not current:
+                return self._superseded("start", reason)
+            # Checked after claiming the slot so a newer start still
+            # supersedes a waiting stop. No operation time is recorded:
+            # nothing was commanded, so no rate-limit window is owed.
+            if self._is_on is True and normalized_target in (
+                None,
+                self._current_amperage,
+            ):
+                self.logger.info(
+                    "Charger already running at %sA - start skipped",
+                    self._current_amperage,
+                )
+                return OperationResult(
+                    success=True,
+                    operation="start",
+                    reason=f"Already running ({self._current_amperage}A)",
+                    amperage=self._current_amperage,
+                )
             try:
                 self.logger.separator()
                 self.logger.start(f"{self.logger.CHARGER} Start Charger")
-                self.logger.info("Reason: %s", reason or "No reason provided")
-                await self._wait_for_rate_limit()
-                await self._refresh_state()
-
-                if target_amps is not None:
-                    normalized_target = self._normalize_target_amps(target_amps)
-                    await self._set_amperage_internal(normalized_target)
-                    await asyncio.sleep(CHARGER_AMPERAGE_STABILIZATION_DELAY)
-
-                await self._call_service(
-                    "switch",
-                    "turn_on",
-                    {"entity_id": self._charger_switch},
-                )
-                await asyncio.sleep(CHARGER_START_SEQUENCE_DELAY)
-
-                self._record_operation_time()
-                await self._refresh_state()
+                self.logger.info("Reason: %s", reason)
+                await self._start_charger_unlocked(normalized_target)
                 await self._emit_operation_diagnostic(
                     "charger_start",
                     "succeeded",
                     reason_code="command_executed",
-                    reason_detail=reason or "No reason provided",
+                    reason_detail=reason,
                     target_amps=self._current_amperage,
                 )
                 return OperationResult(
@@ -290,38 +435,43 @@ class ChargerController:
                     "charger_start",
                     "failed",
                     reason_code="command_failed",
-                    reason_detail=reason or "No reason provided",
-                    target_amps=self._normalize_target_amps(target_amps)
-                    if target_amps is not None
-                    else None,
+                    reason_detail=reason,
+                    target_amps=normalized_target,
                     error_message=str(ex),
                 )
                 return OperationResult(
                     success=False,
                     operation="start",
                     reason=reason,
-                    amperage=self._normalize_target_amps(target_amps)
-                    if target_amps is not None
-                    else None,
+                    amperage=normalized_target,
                     error_message=str(ex),
                 )
             finally:
                 self.logger.separator()
 
-    async def stop_charger(self, reason: str = "") -> OperationResult:
+    async def stop_charger(self, reason: str = _NO_REASON) -> OperationResult:
         """Stop the charger."""
-        async with self._lock:
+        # A stop also overrides any amperage change still waiting to run.
+        async with self._rate_limited_lock(_SLOT_POWER, _SLOT_AMPERAGE) as current:
+            if not current:
+                return self._superseded("stop", reason)
+            if self._is_on is False:
+                self.logger.info("Charger already off - stop skipped")
+                return OperationResult(
+                    success=True,
+                    operation="stop",
+                    reason="Already stopped",
+                )
             try:
                 self.logger.separator()
                 self.logger.start(f"{self.logger.CHARGER} Stop Charger")
-                self.logger.info("Reason: %s", reason or "No reason provided")
-                await self._wait_for_rate_limit()
+                self.logger.info("Reason: %s", reason)
                 await self._stop_charger_unlocked()
                 await self._emit_operation_diagnostic(
                     "charger_stop",
                     "succeeded",
                     reason_code="command_executed",
-                    reason_detail=reason or "No reason provided",
+                    reason_detail=reason,
                 )
                 return OperationResult(
                     success=True,
@@ -334,7 +484,7 @@ class ChargerController:
                     "charger_stop",
                     "failed",
                     reason_code="command_failed",
-                    reason_detail=reason or "No reason provided",
+                    reason_detail=reason,
                     error_message=str(ex),
                 )
                 return OperationResult(
@@ -346,11 +496,23 @@ class ChargerController:
             finally:
                 self.logger.separator()
 
-    async def set_amperage(self, target_amps: int, reason: str = "") -> OperationResult:
+    async def set_amperage(
+        self,
+        target_amps: int,
+        reason: str = _NO_REASON,
+    ) -> OperationResult:
         """Set charger amperage with safe decrease handling."""
-        async with self._lock:
-            normalized_target = self._normalize_target_amps(target_amps)
+        normalized_target = self._normalize_target_amps(target_amps)
+
+        # Fast path: a no-op request skips the rate limit (bouncy sensors
+        # repeat the same target). Only safe while nothing is queued: a parked
+        # request for another target must still be superseded by this one.
+        if self._is_idle() and self._current_amperage == normalized_target:
+            return await self._already_at_target(normalized_target)
 
+        async with self._rate_limited_lock(_SLOT_AMPERAGE) as current:
+            if not current:
+                return self._superseded("set_amperage", reason)
             try:
                 self.logger.separator()
                 self.logger.start(f"{self.logger.CHARGER} Set Amperage")
@@ -359,31 +521,19 @@ class ChargerController:
                     normalized_target,
                     self._current_amperage,
                 )
-                self.logger.info("Reason: %s", reason or "No reason provided")
+                self.logger.info("Reason: %s", reason)
 
-                await self._refresh_state()
+                # Re-check under the lock: an operation we waited on may have
+                # already moved the charger to this target.
                 if self._current_amperage == normalized_target:
-                    await self._emit_operation_diagnostic(
-                        "charger_set_amperage",
-                        "succeeded",
-                        reason_code="already_at_target",
-                        reason_detail=f"Already at target ({normalized_target}A)",
-                        target_amps=normalized_target,
-                    )
-                    return OperationResult(
-                        success=True,
-                        operation="set_amperage",
-                        reason=f"Already at target ({normalized_target}A)",
-                        amperage=normalized_target,
-                    )
+                    return await self._already_at_target(normalized_target)
 
-                await self._wait_for_rate_limit()
                 operation = await self._set_amperage_unlocked(normalized_target)
                 await self._emit_operation_diagnostic(
                     "charger_set_amperage",
                     "succeeded",
                     reason_code="command_executed",
-                    reason_detail=reason or "No reason provided",
+                    reason_detail=reason,
                     target_amps=normalized_target,
                 )
                 return OperationResult(
@@ -398,7 +548,7 @@ class ChargerController:
                     "charger_set_amperage",
                     "failed",
                     reason_code="command_failed",
-                    reason_detail=reason or "No reason provided",
+                    reason_detail=reason,
                     target_amps=normalized_target,
                     error_message=str(ex),
                 )
@@ -417,20 +567,24 @@ class ChargerController:
         reason: str = "Grid import detected",
     ) -> OperationResult:
         """Reduce charging amperage by one level for grid import protection."""
-        async with self._lock:
+        # Urgent: the interval only spares the charger from rapid toggling,
+        # while shedding load on grid import cannot wait for it.
+        async with self._rate_limited_lock(_SLOT_AMPERAGE, urgent=True) as current:
+            if not current:
+                return self._superseded("adjust_for_grid_import", reason)
             try:
                 self.logger.separator()
                 self.logger.start(f"{self.logger.CHARGER} Grid Import Protection")
                 self.logger.info("Reason: %s", reason)
-                await self._refresh_state()
 
                 current_amps = self._current_amperage or 0
                 next_amps = AmperageCalculator.get_next_level_down(
                     current_amps, self._amp_levels
                 )
-                await self._wait_for_rate_limit()
 
                 if next_amps == 0:
+                    # Stopping also supersedes any queued start/stop request.
+                    self._claim_slots(_SLOT_POWER)
                     await self._stop_charger_unlocked()
                     return OperationResult(
                         success=True,
@@ -464,13 +618,24 @@ class ChargerController:
         """Gradually recover charging amperage toward target by one level."""
         normalized_target = self._normalize_target_amps(target_amps)
 
-        async with self._lock:
+        # Fast path: nothing to recover and nothing queued, skip the lock.
+        current_amps = self._current_amperage or 0
+        if self._is_idle() and current_amps >= normalized_target:
+            return OperationResult(
+                success=True,
+                operation="recover_to_target",
+                reason=f"Already at target ({current_amps}A)",
+                amperage=current_amps,
+            )
+
+        async with self._rate_limited_lock(_SLOT_AMPERAGE) as current:
+            if not current:
+                return self._superseded("recover_to_target", reason)
             try:
                 self.logger.separator()
                 self.logger.start(f"{self.logger.CHARGER} Amperage Recovery")
                 self.logger.info("Target: %sA", normalized_target)
                 self.logger.info("Reason: %s", reason)
-                await self._refresh_state()
 
                 current_amps = self._current_amperage or 0
                 if current_amps >= normalized_target:
@@ -481,8 +646,6 @@ class ChargerController:
                         amperage=current_amps,
                     )
 
-                await self._wait_for_rate_limit()
-
                 if not self._is_on or current_amps == 0:
                     await self._start_charger_unlocked(normalized_target)
                     return OperationResult(
@@ -516,31 +679,55 @@ class ChargerController:
             finally:
                 self.logger.separator()
 
+    def _is_idle(self) -> bool:
+        """Return True when no operation is running or waiting for its turn."""
+        return self._pending_requests == 0 and not self._lock.locked()
+
+    async def _already_at_target(self, target_amps: int) -> OperationResult:
+        """Report a set_amperage request that needs no charger command."""
+        await self._emit_operation_diagnostic(
+            "charger_set_amperage",
+            "succeeded",
+            reason_code="already_at_target",
+            reason_detail=f"Already at target ({target_amps}A)",
+            target_amps=target_amps,
+        )
+        return OperationResult(
+            success=True,
+            operation="set_amperage",
+            reason=f"Already at target ({target_amps}A)",
+            amperage=target_amps,
+        )
+
     async def _start_charger_unlocked(self, target_amps: Optional[int]) -> None:
-        """Start the charger without reacquiring the controller lock."""
+        """Start the charger without reacquiring the controller lock.
+
+        From a known-off state the setpoint is only stored, not applied, so
+        set and turn_on go out back-to-back and share a single settle delay.
+        """
         if target_amps is not None:
             await self._set_amperage_internal(target_amps)
+            if self._is_on is False:
+                await self._switch_charger(True)
+                await asyncio.sleep(
+                    max(
+                        CHARGER_AMPERAGE_STABILIZATION_DELAY,
+                        CHARGER_START_SEQUENCE_DELAY,
+                    )
+                )
+                self._record_operation_time()
+                return
             await asyncio.sleep(CHARGER_AMPERAGE_STABILIZATION_DELAY)
 
-        await self._call_service(
-            "switch",
-            "turn_on",
-            {"entity_id": self._charger_switch},
-        )
+        await self._switch_charger(True)
         await asyncio.sleep(CHARGER_START_SEQUENCE_DELAY)
         self._record_operation_time()
-        await self._refresh_state()
 
     async def _stop_charger_unlocked(self) -> None:
         """Stop the charger without reacquiring the controller lock."""
-        await self._call_service(
-            "switch",
-            "turn_off",
-            {"entity_id": self._charger_switch},
-        )
+        await self._switch_charger(False)
         await asyncio.sleep(CHARGER_COMMAND_DELAY)
         self._record_operation_time()
-        await self._refresh_state()
 
     async def _set_amperage_unlocked(self, target_amps: int) -> str:
         """Set charger amperage without reacquiring the controller lock.
@@ -550,7 +737,6 @@ class ChargerController:
         wallboxes accept a live current reduction, so we set the lower value
         directly — no stop, no ~6-8s interruption per step (v2.0.0).
         """
-        await self._refresh_state()
         current_amps = self._current_amperage or 0
         is_on = bool(self._is_on)
 
@@ -564,65 +750,214 @@ class ChargerController:
 
         await self._set_amperage_internal(target_amps)
         self._record_operation_time()
-        await self._refresh_state()
         return "set_amperage"
 
     async def _decrease_amperage_unlocked(self, target_amps: int) -> None:
-        """Decrease amperage using the safe stop/set/start sequence."""
-        await self._call_service(
-            "switch",
-            "turn_off",
-            {"entity_id": self._charger_switch},
-        )
+        """Decrease amperage using the safe stop/set/start sequence.
+
+        Runs under the controller lock on purpose: a concurrent stop landing
+        between the steps would be undone by the final turn_on. State readers
+        (is_charging, get_current_amperage) never take the lock, and every step
+        updates the cache as it is commanded, so they see progress mid-sequence.
+        """
+        await self._switch_charger(False)
         await asyncio.sleep(CHARGER_STOP_SEQUENCE_DELAY)
         await self._set_amperage_internal(target_amps)
         await asyncio.sleep(CHARGER_AMPERAGE_STABILIZATION_DELAY)
-        await self._call_service(
-            "switch",
-            "turn_on",
-            {"entity_id": self._charger_switch},
-        )
+        await self._switch_charger(True)
         await asyncio.sleep(CHARGER_START_SEQUENCE_DELAY)
         self._record_operation_time()
-        await self._refresh_state()
+
+    async def _switch_charger(self, turn_on: bool) -> None:
+        """Turn the charger switch on/off and cache the commanded state."""
+        self._is_on = turn_on
+        self._last_command_time = self._loop.time()
+        try:
+            await self._call_service(
+                "switch",
+                "turn_on" if turn_on else "turn_off",
+                self._switch_payload,
+            )
+        except Exception:
+            # The command may not have landed: fall back to HA's view.
+            await self._refresh_state()
+            raise
 
     async def _set_amperage_internal(self, amps: int) -> None:
-        """Set the configured charger amperage entity."""
-        service_domain, service_name, data = self._current_control.build_service_call(amps)
-        await self._call_service(service_domain, service_name, data)
+        """Set the configured charger amperage entity and cache the setpoint."""
+        service_call = self._amperage_calls.get(amps)
+        if service_call is None:
+            # Bounded by the model's amp levels (targets are normalized).
+            service_call = self._current_control.build_service_call(amps)
+            self._amperage_calls[amps] = service_call
+        service_domain, service_name, data = service_call
+        self._current_amperage = amps
+        self._last_command_time = self._loop.time()
+        try:
+            await self._call_service(service_domain, service_name, data)
+        except Exception:
+            await self._refresh_state()
+            raise
 
-    async def _wait_for_rate_limit(self) -> None:
-        """Wait until the minimum operation interval has elapsed."""
-        if self._last_operation_time is None:
-            return
+    @asynccontextmanager
+    async def _rate_limited_lock(
+        self, *slots: str, urgent: bool = False
+    ) -> AsyncIterator[bool]:
+        """Wait out the rate limit, then hold the lock for one operation.
 
-        elapsed = (dt_util.now() - self._last_operation_time).total_seconds()
-        if elapsed >= CHARGER_MIN_OPERATION_INTERVAL:
-            return
+        The (up to CHARGER_MIN_OPERATION_INTERVAL) wait happens outside the
+        lock so fast-path callers are never serialized behind a sleeper. If
+        another operation completed while we waited, its new deadline applies.
 
-        wait_time = CHARGER_MIN_OPERATION_INTERVAL - elapsed
-        self.logger.info("Rate limit active, waiting %.1fs", wait_time)
-        await asyncio.sleep(wait_time)
+        Yields True with the lock held, or False (without the lock) when a
+        newer request claimed one of ``slots`` while this one was waiting —
+        its command would be immediately overridden, so it is dropped — or
+        when the controller has been removed.
+
+        ``urgent`` requests still claim ``slots`` (superseding older waiters)
+        but skip the rate-limit wait; the operation they run re-arms the
+        deadline for everyone queued behind them.
+        """
+        ticket = self._claim_slots(*slots)
+
+        def superseded() -> bool:
+            return self._shutdown or any(
+                self._slot_tickets[slot] != ticket for slot in slots
+            )
+
+        self._pending_requests += 1
+        try:
+            if urgent:
+                if self._next_operation_at > self._loop.time():
+                    self.logger.info("Bypassing rate limit for urgent request")
+                if self._shutdown:
+                    yield False
+                    return
+                async with self._lock:
+                    yield True
+                return
+
+            while True:
+                deadline = self._next_operation_at
+                elapsed = await self._wait_for_rate_limit()
+                if superseded():
+                    self.logger.info(
+                        "Dropping request - controller removed"
+                        if self._shutdown
+                        else "Dropping stale request - superseded by a newer one"
+                    )
+                    yield False
+                    return
+                if not elapsed:
+                    continue
+                await self._lock.acquire()
+                if self._next_operation_at == deadline and not superseded():
+                    break
+                self._lock.release()
+
+            try:
+                yield True
+            finally:
+                self._lock.release()
+        finally:
+            self._pending_requests -= 1
+
+    def _claim_slots(self, *slots: str) -> int:
+        """Claim ``slots`` for a new request, superseding older waiters."""
+        ticket = next(self._request_tickets)
+        for slot in slots:
+            self._slot_tickets[slot] = ticket
+        if self._pending_requests:
+            # Let waiters we just superseded bail out now, not at their deadline.
+            self._wake_waiters()
+        return ticket
+
+    def _superseded(self, operation: str, reason: str) -> OperationResult:
+        """Report a request dropped in favour of a newer one.
+
+        Reported as success: the outcome equals running it and then the newer
+        request, minus the wasted charger cycle. Requests dropped because the
+        controller was removed are reported as failures.
+        """
+        if self._shutdown:
+            return OperationResult(
+                success=False,
+                operation=operation,
+                reason=reason,
+                error_message="Charger controller removed",
+            )
+        return OperationResult(
+            success=True,
+            operation=operation,
+            reason=f"Superseded by a newer request ({reason})",
+        )
+
+    async def _wait_for_rate_limit(self) -> bool:
+        """Wait until the minimum operation interval has elapsed.
+
+        Returns False if woken early by _wake_waiters() so the caller can
+        re-evaluate (e.g. drop a superseded request) before the deadline.
+        """
+        wait_time = self._next_operation_at - self._loop.time()
+        if wait_time <= 0:
+            return True
+
+        self.logger.info(
+            "Rate limit active, waiting %.1fs (%s request(s) pending)",
+            wait_time,
+            self._pending_requests,
+        )
+        sleeper = asyncio.ensure_future(asyncio.sleep(wait_time))
+        waker = asyncio.ensure_future(self._wake.wait())
+        try:
+            await asyncio.wait(
+                (sleeper, waker), return_when=asyncio.FIRST_COMPLETED
+            )
+            return sleeper.done()
+        finally:
+            sleeper.cancel()
+            waker.cancel()
+
+    def _wake_waiters(self) -> None:
+        """Wake every task currently sleeping in _wait_for_rate_limit()."""
+        self._wake.set()
+        self._wake = asyncio.Event()
 
     def _record_operation_time(self) -> None:
-        """Record the completion time of the last operation."""
-        self._last_operation_time = dt_util.now()
+        """Record completion of an operation and arm the rate-limit deadline."""
+        self._next_operation_at = self._loop.time() + CHARGER_MIN_OPERATION_INTERVAL
 
     def _normalize_target_amps(self, target_amps: int | float | None) -> int:
         """Normalize a target amperage to the nearest supported level."""
         if target_amps is None:
             return self._amp_levels[0]
-        return min(self._amp_levels, key=lambda value: abs(value - int(target_amps)))
+
+        target = int(target_amps)
+        if target in self._amp_level_set:
+            return target
+
+        levels = self._sorted_amp_levels
+        index = bisect_left(levels, target)
+        if index == 0:
+            return levels[0]
+        if index == len(levels):
+            return levels[-1]
+        below, above = levels[index - 1], levels[index]
+        # Ties resolve to the lower level, as the previous min() scan did.
+        return below if target - below <= above - target else above
 
     async def _call_service(self, domain: str, service: str, data: dict):
         """Call a Home Assistant service with timeout and error handling."""
         try:
-            async with async_timeout.timeout(SERVICE_CALL_TIMEOUT):
-                await self.hass.services.async_call(
-                    domain,
-                    service,
-                    data,
-                    blocking=True,
+            async with _get_entity_lock(self.hass, data["entity_id"], self):
+                await asyncio.wait_for(
+                    self.hass.services.async_call(
+                        domain,
+                        service,
+                        data,
+                        blocking=True,
+                    ),
+                    timeout=SERVICE_CALL_TIMEOUT,
                 )
         except asyncio.TimeoutError:
             self.logger.error("Service call timeout: %s.%s", domain, service)
@@ -632,12 +967,18 @@ class ChargerController:
             raise
 
     async def is_charging(self) -> bool:
-        """Return whether the charger is currently on."""
-        await self._refresh_state()
+        """Return whether the charger is currently on.
+
+        Served from the cache kept current by our own commands and the state
+        subscription; HA is only read while the switch state is still unknown.
+        """
+        if self._is_on is None:
+            await self._refresh_state()
         return self._is_on or False
 
     async def get_current_amperage(self) -> Optional[int]:
-        """Return the current configured amperage."""
-        await self._refresh_state()
+        """Return the current configured amperage (cached, see is_charging)."""
+        if self._current_amperage is None:
+            await self._refresh_state()
         return self._current_amperage
 
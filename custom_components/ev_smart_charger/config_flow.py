@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -56,33 +59,58 @@ from .const import (
 
 CURRENT_CONTROL_DOMAINS = ["number", "select", "input_number", "input_select"]
 ENERGY_TARGET_DOMAINS = ["input_number", "number"]
+_MOBILE_APP_PREFIX = "mobile_app_"
+_MOBILE_APP_PREFIX_LEN = len(_MOBILE_APP_PREFIX)
+_NOTIFY_SERVICES_CACHE_KEY = "_mobile_notify_services"
+_NOTIFY_SERVICES_CACHE_TTL = 5.0  # seconds
 
+_USER_SCHEMA = vol.Schema({vol.Optional(CONF_NAME, default=DEFAULT_NAME): str})
 
-def _get_mobile_notify_services(hass) -> list[str]:
-    """Get list of available mobile_app notify services."""
-    notify_services = hass.services.async_services().get("notify", {})
-    return sorted(
-        service
-        for service in notify_services
-        if service.startswith("mobile_app_")
+
+def _get_mobile_notify_services(hass) -> tuple[str, ...]:
+    """Get list of available mobile_app notify services.
+
+    Cached per hass for a few seconds: the notifications step is rendered by
+    both flows and every render would otherwise rescan all notify services.
+    """
+    cache = hass.data.setdefault(DOMAIN, {})
+    now = time.monotonic()
+    cached = cache.get(_NOTIFY_SERVICES_CACHE_KEY)
+    if cached is not None and now - cached[0] < _NOTIFY_SERVICES_CACHE_TTL:
+        return cached[1]
+
+    services_for_domain = getattr(hass.services, "async_services_for_domain", None)
+    if services_for_domain is not None:
+        notify_services = services_for_domain("notify")
+    else:
+        # Older cores: snapshot of the whole registry.
+        notify_services = hass.services.async_services().get("notify") or {}
+    services = tuple(
+        sorted(
+            service
+            for service in notify_services
+            if service[:_MOBILE_APP_PREFIX_LEN] == _MOBILE_APP_PREFIX
+        )
     )
+    cache[_NOTIFY_SERVICES_CACHE_KEY] = (now, services)
+    return services
 
 
 def _validate_external_connectors(hass, user_input: dict[str, Any]) -> dict[str, str]:
-    """Validate shared external connector settings."""
-    errors: dict[str, str] = {}
+    """Validate shared external connector settings.
 
-    battery_capacity = user_input.get(CONF_BATTERY_CAPACITY, DEFAULT_BATTERY_CAPACITY)
-    if battery_capacity < MIN_BATTERY_CAPACITY or battery_capacity > MAX_BATTERY_CAPACITY:
-        errors["battery_capacity"] = "invalid_battery_capacity"
+    Battery capacity is range-checked by the schema (vol.Range) before the
+    step handler ever sees it.
+    """
+    errors: dict[str, str] = {}
 
     energy_target = user_input.get(CONF_ENERGY_FORECAST_TARGET)
     if energy_target:
-        state = hass.states.get(energy_target)
-        if state is None:
-            errors["energy_forecast_target"] = "entity_not_found"
-        elif state.domain not in ENERGY_TARGET_DOMAINS:
+        # The domain is the entity_id prefix: reject it before the state lookup.
+        if energy_target.partition(".")[0] not in ENERGY_TARGET_DOMAINS:
             errors["energy_forecast_target"] = "invalid_domain"
+        elif hass.states.get(energy_target) is None:
+            errors["energy_forecast_target"] = "entity_not_found"
 
     return errors
 
@@ -115,6 +143,16 @@ def _entity_selector(domains: str | list[str]) -> selector.EntitySelector:
     return selector.EntitySelector(selector.EntitySelectorConfig(domain=domains))
 
 
+# Selectors are immutable once built: share one instance per domain set across
+# every schema and render instead of rebuilding (and re-validating) each time.
+_SEL_SWITCH = _entity_selector("switch")
+_SEL_CHARGER_CURRENT = _entity_selector(CURRENT_CONTROL_DOMAINS)
+_SEL_SENSOR = _entity_selector("sensor")
+_SEL_BINARY_SENSOR = _entity_selector("binary_sensor")
+_SEL_PERSON = _entity_selector("person")
+_SEL_ENERGY_TARGET = _entity_selector(ENERGY_TARGET_DOMAINS)
+
+
 def _field_config(default: Any) -> dict[str, Any]:
     """Return voluptuous field kwargs only when a real default is available."""
     if default is None:
@@ -122,29 +160,27 @@ def _field_config(default: Any) -> dict[str, Any]:
     return {"default": default}
 
 
+def _field(
+    marker: type[vol.Marker], key: str, current_data: Mapping[str, Any]
+) -> vol.Marker:
+    """Build a schema key, prefilled from ``current_data`` when it has a value."""
+    return marker(key, **_field_config(current_data.get(key)))
+
+
 def _charger_schema(current_data: dict[str, Any] | None = None) -> vol.Schema:
     """Build the charger entities schema."""
     current_data = current_data or {}
     return vol.Schema(
         {
-            vol.Required(
-                CONF_EV_CHARGER_SWITCH,
-                **_field_config(current_data.get(CONF_EV_CHARGER_SWITCH)),
-            ): _entity_selector("switch"),
-            vol.Required(
-                CONF_EV_CHARGER_CURRENT,
-                **_field_config(current_data.get(CONF_EV_CHARGER_CURRENT)),
-            ): _entity_selector(CURRENT_CONTROL_DOMAINS),
+            _field(vol.Required, CONF_EV_CHARGER_SWITCH, current_data): _SEL_SWITCH,
+            _field(vol.Required, CONF_EV_CHARGER_CURRENT, current_data): _SEL_CHARGER_CURRENT,
             # v2.2.0: Optional (was Required). Now a FALLBACK for the charging
             # power SSOT (used when no charging-power sensor is mapped) and the
             # source for plug/idle/finished lifecycle that power cannot express.
             # Never removed — kept prefilled in reconfigure/options so users don't
             # silently drop their fallback. No "Required-if-set" lock (unlike
             # soc_home) because status maps to zero helper entities → no orphans.
-            vol.Optional(
-                CONF_EV_CHARGER_STATUS,
-                **_field_config(current_data.get(CONF_EV_CHARGER_STATUS)),
-            ): _entity_selector("sensor"),
+            _field(vol.Optional, CONF_EV_CHARGER_STATUS, current_data): _SEL_SENSOR,
         }
     )
 
@@ -228,8 +264,8 @@ def _sensor_schema(
     soc_home_marker = vol.Required if existing_soc_home else vol.Optional
 
     fields: dict[Any, Any] = {
-        vol.Required(CONF_SOC_CAR, **_field_config(current_data.get(CONF_SOC_CAR))): _entity_selector("sensor"),
-        soc_home_marker(CONF_SOC_HOME, **_field_config(existing_soc_home)): _entity_selector("sensor"),
+        _field(vol.Required, CONF_SOC_CAR, current_data): _SEL_SENSOR,
+        soc_home_marker(CONF_SOC_HOME, **_field_config(existing_soc_home)): _SEL_SENSOR,
     }
 
     # Per-quantity power sensors, grouped L1[/L2/L3]. Single-phase = L1 only.
@@ -238,10 +274,10 @@ def _sensor_schema(
         (CONF_HOME_CONSUMPTION, CONF_HOME_CONSUMPTION_L2, CONF_HOME_CONSUMPTION_L3),
         (CONF_GRID_IMPORT, CONF_GRID_IMPORT_L2, CONF_GRID_IMPORT_L3),
     ):
-        fields[vol.Required(l1, **_field_config(current_data.get(l1)))] = _entity_selector("sensor")
+        fields[_field(vol.Required, l1, current_data)] = _SEL_SENSOR
         if three_phase:
-            fields[vol.Required(l2, **_field_config(current_data.get(l2)))] = _entity_selector("sensor")
-            fields[vol.Required(l3, **_field_config(current_data.get(l3)))] = _entity_selector("sensor")
+            fields[_field(vol.Required, l2, current_data)] = _SEL_SENSOR
+            fields[_field(vol.Required, l3, current_data)] = _SEL_SENSOR
 
     # v2.2.0: measured EV charging power — the SSOT for "is the car drawing now".
     # Optional (most installs lack a charger CT; the switch echo + status string
@@ -249,24 +285,16 @@ def _sensor_schema(
     # "all three or none" rule is enforced in ChargingModel.read_charging_power
     # (Optional fields cannot be made schema-Required without breaking the
     # single-phase / no-sensor cases).
-    fields[
-        vol.Optional(CONF_CHARGING_POWER, **_field_config(current_data.get(CONF_CHARGING_POWER)))
-    ] = _entity_selector("sensor")
+    fields[_field(vol.Optional, CONF_CHARGING_POWER, current_data)] = _SEL_SENSOR
     if three_phase:
-        fields[
-            vol.Optional(CONF_CHARGING_POWER_L2, **_field_config(current_data.get(CONF_CHARGING_POWER_L2)))
-        ] = _entity_selector("sensor")
-        fields[
-            vol.Optional(CONF_CHARGING_POWER_L3, **_field_config(current_data.get(CONF_CHARGING_POWER_L3)))
-        ] = _entity_selector("sensor")
+        fields[_field(vol.Optional, CONF_CHARGING_POWER_L2, current_data)] = _SEL_SENSOR
+        fields[_field(vol.Optional, CONF_CHARGING_POWER_L3, current_data)] = _SEL_SENSOR
 
     # v2.6.0 (issue #36): optional grid-availability binary_sensor. When mapped
     # and OFF, Night Smart Charge grid mode stops (avoids draining the home
     # battery during a grid outage on hybrid Battery First/UPS inverters).
     # Unmapped → byte-for-byte legacy behaviour.
-    fields[
-        vol.Optional(CONF_GRID_AVAILABLE, **_field_config(current_data.get(CONF_GRID_AVAILABLE)))
-    ] = _entity_selector("binary_sensor")
+    fields[_field(vol.Optional, CONF_GRID_AVAILABLE, current_data)] = _SEL_BINARY_SENSOR
 
     return vol.Schema(fields)
 
@@ -287,14 +315,8 @@ def _pv_forecast_schema(current_data: dict[str, Any] | None = None) -> vol.Schem
     current_data = current_data or {}
     return vol.Schema(
         {
-            vol.Optional(
-                CONF_PV_FORECAST,
-                **_field_config(current_data.get(CONF_PV_FORECAST)),
-            ): _entity_selector("sensor"),
-            vol.Optional(
-                CONF_PV_FORECAST_TOMORROW,
-                **_field_config(current_data.get(CONF_PV_FORECAST_TOMORROW)),
-            ): _entity_selector("sensor"),
+            _field(vol.Optional, CONF_PV_FORECAST, current_data): _SEL_SENSOR,
+            _field(vol.Optional, CONF_PV_FORECAST_TOMORROW, current_data): _SEL_SENSOR,
         }
     )
 
@@ -324,34 +346,59 @@ def _hybrid_inverter_schema(
                 ),
             )
         ] = selector.BooleanSelector()
-    fields[
-        vol.Optional(
-            CONF_BATTERY_POWER,
-            **_field_config(current_data.get(CONF_BATTERY_POWER)),
-        )
-    ] = _entity_selector("sensor")
+    fields[_field(vol.Optional, CONF_BATTERY_POWER, current_data)] = _SEL_SENSOR
     return vol.Schema(fields)
 
 
 def _notifications_schema(hass, current_data: dict[str, Any] | None = None) -> vol.Schema:
     """Build the notifications schema."""
     current_data = current_data or {}
+    notify_services = _get_mobile_notify_services(hass)
+    default_services = current_data.get(CONF_NOTIFY_SERVICES, [])
+    if default_services is not None:
+        # Saved services that no longer exist would fail the selector's
+        # option check on submit; only prefill the ones still registered.
+        live = frozenset(notify_services)
+        default_services = tuple(
+            service for service in default_services if service in live
+        )
+    return _build_notifications_schema(
+        notify_services,
+        default_services,
+        current_data.get(CONF_CAR_OWNER),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_notifications_schema(
+    notify_services: tuple[str, ...],
+    default_services: tuple[str, ...] | None,
+    car_owner_default: str | None,
+) -> vol.Schema:
+    """Build (and memoize) the notifications schema for one set of inputs.
+
+    Renders with the same notify-service inventory and saved defaults get the
+    same Schema instance back instead of a fresh SelectSelector each time.
+    """
     return vol.Schema(
         {
             vol.Optional(
                 CONF_NOTIFY_SERVICES,
-                **_field_config(current_data.get(CONF_NOTIFY_SERVICES, [])),
+                **_field_config(
+                    list(default_services) if default_services is not None else None
+                ),
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=_get_mobile_notify_services(hass),
+                    # The selector schema only accepts a list.
+                    options=list(notify_services),
                     multiple=True,
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
             ),
             vol.Required(
                 CONF_CAR_OWNER,
-                **_field_config(current_data.get(CONF_CAR_OWNER)),
-            ): _entity_selector("person"),
+                **_field_config(car_owner_default),
+            ): _SEL_PERSON,
         }
     )
 
@@ -370,10 +417,7 @@ def _external_connectors_schema(current_data: dict[str, Any] | None = None) -> v
                 vol.Coerce(float),
                 vol.Range(min=MIN_BATTERY_CAPACITY, max=MAX_BATTERY_CAPACITY),
             ),
-            vol.Optional(
-                CONF_ENERGY_FORECAST_TARGET,
-                **_field_config(current_data.get(CONF_ENERGY_FORECAST_TARGET)),
-            ): _entity_selector(ENERGY_TARGET_DOMAINS),
+            _field(vol.Optional, CONF_ENERGY_FORECAST_TARGET, current_data): _SEL_ENERGY_TARGET,
         }
     )
 
@@ -392,6 +436,31 @@ def _dashboard_schema(current_data: dict[str, Any] | None = None) -> vol.Schema:
     )
 
 
+def _step_placeholders(total_steps: int) -> tuple[dict[str, str], ...]:
+    """Build the "step N of M" placeholders for every step of a flow."""
+    total = str(total_steps)
+    return tuple(
+        {"step": str(step), "total_steps": total}
+        for step in range(1, total_steps + 1)
+    )
+
+
+# Shared read-only placeholder dicts, indexed by step number - 1. The initial
+# flow has 10 steps; reconfigure and options share the same 9.
+_SETUP_PLACEHOLDERS = _step_placeholders(10)
+_EDIT_PLACEHOLDERS = _step_placeholders(9)
+
+# Initial-flow schemas have no per-entry defaults: build them once at import.
+# Reconfigure/options steps prefill from entry data and are built per render.
+_ENTITIES_SCHEMA = _charger_schema()
+_SENSORS_SCHEMA = _sensor_schema()
+_SENSORS_SCHEMA_THREE_PHASE = _sensor_schema(three_phase=True)
+_HYBRID_INVERTER_SCHEMA = _hybrid_inverter_schema(include_toggle=True)
+_PV_FORECAST_SCHEMA = _pv_forecast_schema()
+_EXTERNAL_CONNECTORS_SCHEMA = _external_connectors_schema()
+_DASHBOARD_SCHEMA = _dashboard_schema()
+
+
 class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the EV Smart Charger config flow."""
 
@@ -417,9 +486,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({vol.Optional(CONF_NAME, default=DEFAULT_NAME): str}),
+            data_schema=_USER_SCHEMA,
             errors={},
-            description_placeholders={"step": "1", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[0],
         )
 
     async def async_step_phase_mode(self, user_input: dict[str, Any] | None = None):
@@ -432,7 +501,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="phase_mode",
             data_schema=_phase_mode_schema(self.hass),
             errors={},
-            description_placeholders={"step": "2", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[1],
         )
 
     async def async_step_charger_model(self, user_input: dict[str, Any] | None = None):
@@ -445,7 +514,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="charger_model",
             data_schema=_charger_model_schema(self.hass),
             errors={},
-            description_placeholders={"step": "3", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[2],
         )
 
     async def async_step_entities(self, user_input: dict[str, Any] | None = None):
@@ -460,9 +529,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="entities",
-            data_schema=_charger_schema(),
+            data_schema=_ENTITIES_SCHEMA,
             errors=errors,
-            description_placeholders={"step": "4", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[3],
         )
 
     async def async_step_sensors(self, user_input: dict[str, Any] | None = None):
@@ -473,9 +542,13 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="sensors",
-            data_schema=_sensor_schema(three_phase=is_three_phase(self.mode_info)),
+            data_schema=(
+                _SENSORS_SCHEMA_THREE_PHASE
+                if is_three_phase(self.mode_info)
+                else _SENSORS_SCHEMA
+            ),
             errors={},
-            description_placeholders={"step": "5", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[4],
         )
 
     async def async_step_hybrid_inverter(self, user_input: dict[str, Any] | None = None):
@@ -486,9 +559,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="hybrid_inverter",
-            data_schema=_hybrid_inverter_schema(include_toggle=True),
+            data_schema=_HYBRID_INVERTER_SCHEMA,
             errors={},
-            description_placeholders={"step": "6", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[5],
         )
 
     async def async_step_pv_forecast(self, user_input: dict[str, Any] | None = None):
@@ -499,9 +572,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="pv_forecast",
-            data_schema=_pv_forecast_schema(),
+            data_schema=_PV_FORECAST_SCHEMA,
             errors={},
-            description_placeholders={"step": "7", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[6],
         )
 
     async def async_step_notifications(self, user_input: dict[str, Any] | None = None):
@@ -514,7 +587,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="notifications",
             data_schema=_notifications_schema(self.hass),
             errors={},
-            description_placeholders={"step": "8", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[7],
         )
 
     async def async_step_external_connectors(self, user_input: dict[str, Any] | None = None):
@@ -529,9 +602,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="external_connectors",
-            data_schema=_external_connectors_schema(),
+            data_schema=_EXTERNAL_CONNECTORS_SCHEMA,
             errors=errors,
-            description_placeholders={"step": "9", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[8],
         )
 
     async def async_step_dashboard(self, user_input: dict[str, Any] | None = None):
@@ -554,9 +627,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="dashboard",
-            data_schema=_dashboard_schema(),
+            data_schema=_DASHBOARD_SCHEMA,
             errors={},
-            description_placeholders={"step": "10", "total_steps": "10"},
+            description_placeholders=_SETUP_PLACEHOLDERS[9],
         )
 
     async def async_step_reconfigure(self, user_input: dict[str, Any] | None = None):
@@ -575,7 +648,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure",
             data_schema=_phase_mode_schema(self.hass, self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "1", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[0],
         )
 
     async def async_step_reconfigure_charger_model(self, user_input: dict[str, Any] | None = None):
@@ -588,7 +661,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_charger_model",
             data_schema=_charger_model_schema(self.hass, self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "2", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[1],
         )
 
     async def async_step_reconfigure_entities(self, user_input: dict[str, Any] | None = None):
@@ -607,7 +680,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_entities",
             data_schema=_charger_schema(self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "3", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[2],
         )
 
     async def async_step_reconfigure_sensors(self, user_input: dict[str, Any] | None = None):
@@ -623,7 +696,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 three_phase=is_three_phase(self.mode_info),
             ),
             errors={},
-            description_placeholders={"step": "4", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[3],
         )
 
     async def async_step_reconfigure_hybrid_inverter(
@@ -642,7 +715,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_hybrid_inverter",
             data_schema=_hybrid_inverter_schema(self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "5", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[4],
         )
 
     async def async_step_reconfigure_pv_forecast(self, user_input: dict[str, Any] | None = None):
@@ -655,7 +728,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_pv_forecast",
             data_schema=_pv_forecast_schema(self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "6", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[5],
         )
 
     async def async_step_reconfigure_notifications(self, user_input: dict[str, Any] | None = None):
@@ -668,7 +741,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_notifications",
             data_schema=_notifications_schema(self.hass, self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "7", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[6],
         )
 
     async def async_step_reconfigure_external_connectors(
@@ -688,7 +761,7 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_external_connectors",
             data_schema=_external_connectors_schema(self._reconfigure_entry.data),
             errors=errors,
-            description_placeholders={"step": "8", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[7],
         )
 
     async def async_step_reconfigure_dashboard(
@@ -718,13 +791,9 @@ class EVSCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="reconfigure_dashboard",
             data_schema=_dashboard_schema(self._reconfigure_entry.data),
             errors={},
-            description_placeholders={"step": "9", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[8],
         )
 
-    def _get_mobile_notify_services(self) -> list[str]:
-        """Get list of available mobile_app notify services."""
-        return _get_mobile_notify_services(self.hass)
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -738,6 +807,9 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
     def __init__(self, config_entry):
         """Initialize options flow."""
         super().__init__(config_entry)
+        # Form defaults. Options edits are written back to entry.data (options
+        # stay empty), so data alone is the current configuration.
+        self._current_data = config_entry.data
         self.mode_info: dict[str, Any] = {}  # v2.0.0: phase_mode + charger_model
         self.charger_info: dict[str, Any] = {}
         self.sensor_info: dict[str, Any] = {}
@@ -754,8 +826,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=_phase_mode_schema(self.hass, self.config_entry.data),
-            description_placeholders={"step": "1", "total_steps": "9"},
+            data_schema=_phase_mode_schema(self.hass, self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[0],
         )
 
     async def async_step_charger_model(self, user_input: dict[str, Any] | None = None):
@@ -766,8 +838,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="charger_model",
-            data_schema=_charger_model_schema(self.hass, self.config_entry.data),
-            description_placeholders={"step": "2", "total_steps": "9"},
+            data_schema=_charger_model_schema(self.hass, self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[1],
         )
 
     async def async_step_entities(self, user_input: dict[str, Any] | None = None):
@@ -784,8 +856,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="entities",
-            data_schema=_charger_schema(self.config_entry.data),
-            description_placeholders={"step": "3", "total_steps": "9"},
+            data_schema=_charger_schema(self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[2],
         )
 
     async def async_step_sensors(self, user_input: dict[str, Any] | None = None):
@@ -797,10 +869,10 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
         return self.async_show_form(
             step_id="sensors",
             data_schema=_sensor_schema(
-                self.config_entry.data,
+                self._current_data,
                 three_phase=is_three_phase(self.mode_info),
             ),
-            description_placeholders={"step": "4", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[3],
         )
 
     async def async_step_hybrid_inverter(self, user_input: dict[str, Any] | None = None):
@@ -814,8 +886,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="hybrid_inverter",
-            data_schema=_hybrid_inverter_schema(self.config_entry.data),
-            description_placeholders={"step": "5", "total_steps": "9"},
+            data_schema=_hybrid_inverter_schema(self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[4],
         )
 
     async def async_step_pv_forecast(self, user_input: dict[str, Any] | None = None):
@@ -826,8 +898,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="pv_forecast",
-            data_schema=_pv_forecast_schema(self.config_entry.data),
-            description_placeholders={"step": "6", "total_steps": "9"},
+            data_schema=_pv_forecast_schema(self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[5],
         )
 
     async def async_step_notifications(self, user_input: dict[str, Any] | None = None):
@@ -838,8 +910,8 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="notifications",
-            data_schema=_notifications_schema(self.hass, self.config_entry.data),
-            description_placeholders={"step": "7", "total_steps": "9"},
+            data_schema=_notifications_schema(self.hass, self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[6],
         )
 
     async def async_step_external_connectors(self, user_input: dict[str, Any] | None = None):
@@ -854,9 +926,9 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="external_connectors",
-            data_schema=_external_connectors_schema(self.config_entry.data),
+            data_schema=_external_connectors_schema(self._current_data),
             errors=errors,
-            description_placeholders={"step": "8", "total_steps": "9"},
+            description_placeholders=_EDIT_PLACEHOLDERS[7],
         )
 
     async def async_step_dashboard(self, user_input: dict[str, Any] | None = None):
@@ -882,10 +954,6 @@ class EVSCOptionsFlow(config_entries.OptionsFlowWithConfigEntry):
 
         return self.async_show_form(
             step_id="dashboard",
-            data_schema=_dashboard_schema(self.config_entry.data),
-            description_placeholders={"step": "9", "total_steps": "9"},
+            data_schema=_dashboard_schema(self._current_data),
+            description_placeholders=_EDIT_PLACEHOLDERS[8],
         )
-
-    def _get_mobile_notify_services(self) -> list[str]:
-        """Get list of available mobile_app notify services."""
-        return _get_mobile_notify_services(self.hass)
@@ -17,7 +17,7 @@ DASHBOARD_ICON = "mdi:ev-station"
 DASHBOARD_RESOURCE_KEY = f"{DOMAIN}_auto_dashboard"
 
 # ========== PLATFORMS ==========
-PLATFORMS = ["switch", "number", "select", "sensor", "time"]
+PLATFORMS: tuple[str, ...] = ("switch", "number", "select", "sensor", "time")
 
 # ========== AUTOMATION PRIORITIES ==========
 PRIORITY_OVERRIDE = 1  # Forza Ricarica (kill switch)
@@ -54,15 +54,15 @@ CHARGING_PROFILES = [
     PROFILE_SOLAR_SURPLUS,
 ]
 
-LEGACY_CHARGING_PROFILES = [
+LEGACY_CHARGING_PROFILES = (
     PROFILE_CHARGE_TARGET,
     PROFILE_CHEAPEST,
-]
+)
 
 # ========== CHARGER AMPERAGE LEVELS ==========
-CHARGER_AMP_LEVELS = [6, 8, 10, 13, 16, 20, 24, 32]  # Tuya-style discrete levels
+CHARGER_AMP_LEVELS = (6, 8, 10, 13, 16, 20, 24, 32)  # Tuya-style discrete levels
 # Generic (non-Tuya) wallboxes accept any integer amperage → 1 A steps (v2.0.0)
-GENERIC_AMP_LEVELS = list(range(6, 33))  # [6, 7, 8, ..., 32]
+GENERIC_AMP_LEVELS = tuple(range(6, 33))  # (6, 7, 8, ..., 32)
 VOLTAGE_EU = 230  # European standard voltage (per phase)
 
 # ========== CHARGING-STATE SSOT (v2.2.0) ==========
@@ -280,6 +280,35 @@ HELPER_CAR_READY_FRIDAY_SUFFIX = "evsc_car_ready_friday"
 HELPER_CAR_READY_SATURDAY_SUFFIX = "evsc_car_ready_saturday"
 HELPER_CAR_READY_SUNDAY_SUFFIX = "evsc_car_ready_sunday"
 
+# Per-day suffixes indexed by date.weekday() (0 = Monday ... 6 = Sunday)
+EV_MIN_SOC_SUFFIX_BY_WEEKDAY = (
+    HELPER_EV_MIN_SOC_MONDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_TUESDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_WEDNESDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_THURSDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_FRIDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_SATURDAY_SUFFIX,
+    HELPER_EV_MIN_SOC_SUNDAY_SUFFIX,
+)
+HOME_MIN_SOC_SUFFIX_BY_WEEKDAY = (
+    HELPER_HOME_MIN_SOC_MONDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_TUESDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_WEDNESDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_THURSDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_FRIDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_SATURDAY_SUFFIX,
+    HELPER_HOME_MIN_SOC_SUNDAY_SUFFIX,
+)
+CAR_READY_SUFFIX_BY_WEEKDAY = (
+    HELPER_CAR_READY_MONDAY_SUFFIX,
+    HELPER_CAR_READY_TUESDAY_SUFFIX,
+    HELPER_CAR_READY_WEDNESDAY_SUFFIX,
+    HELPER_CAR_READY_THURSDAY_SUFFIX,
+    HELPER_CAR_READY_FRIDAY_SUFFIX,
+    HELPER_CAR_READY_SATURDAY_SUFFIX,
+    HELPER_CAR_READY_SUNDAY_SUFFIX,
+)
+
 # Selects
 HELPER_CHARGING_PROFILE_SUFFIX = "evsc_charging_profile"
 
@@ -366,7 +395,7 @@ DEFAULT_NIGHTTIME_SUNRISE_OFFSET = 0  # minutes after sunrise
 
 # ========== NIGHT SMART CHARGE RETRY SETTINGS (v1.6.1) ==========
 NIGHT_CHARGE_START_MAX_RETRIES = 3  # Maximum attempts to start charger
-NIGHT_CHARGE_START_RETRY_DELAYS = [5, 15, 30]  # Seconds between retry attempts (backoff)
+NIGHT_CHARGE_START_RETRY_DELAYS = (5, 15, 30)  # Seconds between retry attempts (backoff)
 
 # ========== DEFAULT VALUES - BOOST CHARGE ==========
 DEFAULT_BOOST_CHARGE_AMPERAGE = 16  # amps
@@ -377,6 +406,9 @@ DEFAULT_BOOST_SCHEDULE_END_TIME = "08:00:00"
 # ========== NIGHT SMART CHARGE WINDOW ACTIVATION SETTINGS (v1.4.4) ==========
 ACTIVATION_GRACE_BEFORE_MINUTES = 2  # Activate 2 minutes before scheduled time (handles clock drift)
 ACTIVATION_GRACE_AFTER_MINUTES = 5   # Continue accepting activation up to 5 minutes after scheduled time
+# While idle, window checks are skipped until this long before the next grace window
+# (matches the "approaching" range of the window-check diagnostic)
+NIGHT_CHARGE_IDLE_WAKE_MARGIN_MINUTES = 30
 
 # ========== DEFAULT VALUES - CAR READY FLAGS ==========
 DEFAULT_CAR_READY_WEEKDAY = True  # Monday-Friday (car needed for work)
@@ -399,6 +431,9 @@ SENSOR_UNAVAILABLE_ERROR_TICKS = 3
 
 # ========== CHARGER CONTROLLER SETTINGS ==========
 CHARGER_MIN_OPERATION_INTERVAL = 30  # seconds between charger operations (rate limiting)
+# A charger state that diverges from what we just commanded within this window
+# is logged as a warning (the device did not follow the command).
+CHARGER_STATE_ECHO_WINDOW = 10  # seconds
 
 # ========== DELAYS ==========
 CHARGER_COMMAND_DELAY = 2  # seconds to wait after charger commands
@@ -413,9 +448,20 @@ SERVICE_CALL_TIMEOUT = 10  # seconds for service calls
 # Date-based log structure: logs/<year>/<month>/<day>.log
 # Example: logs/2025/12/29.log
 # No rotation needed - new file each day, automatic midnight transition
+# Records are buffered and written out on this interval (ERROR and above at once)
+LOG_FILE_FLUSH_INTERVAL = 30  # seconds
+# Rapid toggle flips are applied once, after the toggle has settled
+LOG_TOGGLE_DEBOUNCE = 0.5  # seconds
 
 # ========== EV SOC MONITOR SETTINGS (v1.4.0) ==========
-EV_SOC_MONITOR_INTERVAL = 5  # seconds - polling frequency for cloud sensor reliability
+# Cache updates are driven by source state changes; this is only a safety-net
+# re-read in case an update was missed. (Replaces the 5 s EV_SOC_MONITOR_INTERVAL
+# poll period, removed so nothing silently inherits the slower cadence.)
+EV_SOC_SAFETY_POLL_INTERVAL = 60  # seconds
+# An unchanged SOC is republished at most this often. Until then the cached
+# sensor's last_valid_update (and its last_updated) stay at the previous write,
+# so with a steady SOC they can lag by up to this interval plus one safety poll.
+EV_SOC_CACHE_REFRESH_INTERVAL = 300  # seconds
 
 # ========== HYBRID INVERTER MODE (v1.8.0 — issue #20) ==========
 # User-configurable defaults
@@ -503,7 +549,7 @@ def get_charger_model(config: dict) -> str:
     return config.get(CONF_CHARGER_MODEL, DEFAULT_CHARGER_MODEL)
 
 
-def get_amp_levels(config: dict) -> list[int]:
+def get_amp_levels(config: dict) -> tuple[int, ...]:
     """Return the amperage level set for the configured charger model (v2.0.0).
 
     ``tuya`` → discrete CHARGER_AMP_LEVELS (default, unchanged).
@@ -5,26 +5,34 @@ Monitors cloud-based EV SOC sensor and maintains reliable cached value.
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_SOC_CAR,
-    EV_SOC_MONITOR_INTERVAL,
+    EV_SOC_CACHE_REFRESH_INTERVAL,
+    EV_SOC_SAFETY_POLL_INTERVAL,
     HELPER_CACHED_EV_SOC_SUFFIX,
 )
 from .runtime import EVSCRuntimeData
 from .utils.logging_helper import EVSCLogger
 
+# Source states that carry no usable SOC reading.
+_INVALID_STATES = frozenset({None, "unknown", "unavailable", "none"})
+
 
 class EVSOCMonitor:
     """
     EV SOC Monitor - Reliability layer for cloud-based EV SOC sensors.
 
-    Polls cloud sensor every 5 seconds and updates cached sensor only when
-    cloud sensor has valid values. Maintains last known good value when
-    cloud sensor is unavailable.
+    Follows the cloud sensor's state changes and updates the cached sensor
+    only when the cloud sensor has valid values. Maintains last known good
+    value when cloud sensor is unavailable. A slow periodic re-read backs up
+    the event subscription.
     """
 
     def __init__(
@@ -52,10 +60,11 @@ class EVSOCMonitor:
         self._last_valid_value = None
         self._last_valid_time = None
         self._last_source_state = None  # For change detection
+        self._state_unsub = None
         self._timer_unsub = None
 
     async def async_setup(self):
-        """Setup: discover cache sensor and start polling timer."""
+        """Setup: discover cache sensor and start tracking the source sensor."""
         self.logger.info("Setting up EV SOC Monitor")
 
         if self._runtime_data is not None:
@@ -72,28 +81,42 @@ class EVSOCMonitor:
         self.logger.info(f"Source sensor: {self._source_entity}")
         self.logger.info(f"Cache sensor: {self._cache_entity}")
 
-        # Start polling timer (every 5 seconds)
+        self._state_unsub = async_track_state_change_event(
+            self.hass, [self._source_entity], self._async_source_changed
+        )
+        # Safety net only: normal updates arrive through the state listener.
         self._timer_unsub = async_track_time_interval(
             self.hass,
             self._async_poll_source_sensor,
-            timedelta(seconds=EV_SOC_MONITOR_INTERVAL),
+            timedelta(seconds=EV_SOC_SAFETY_POLL_INTERVAL),
         )
 
+        # Prime the cache from the current source state.
+        await self._async_poll_source_sensor()
+
         self.logger.success(
-            f"EV SOC Monitor active - polling every {EV_SOC_MONITOR_INTERVAL}s"
+            f"EV SOC Monitor active - tracking {self._source_entity} "
+            f"(re-check every {EV_SOC_SAFETY_POLL_INTERVAL}s)"
         )
 
+    async def _async_source_changed(self, event: Event) -> None:
+        """Handle a state change of the source sensor."""
+        await self._async_process_source_state(event.data.get("new_state"))
+
     async def _async_poll_source_sensor(self, now=None):
+        """Re-read the source sensor and update cache if valid."""
+        await self._async_process_source_state(
+            self.hass.states.get(self._source_entity)
+        )
+
+    async def _async_process_source_state(self, source_state: State | None) -> None:
         """
-        Poll source sensor and update cache if valid.
+        Update cache from a source sensor state if valid.
 
         Logging strategy:
         - Silent when source sensor provides valid values (normal operation)
         - WARNING only when using cached value because source unavailable
         """
-        # Read source sensor state
-        source_state = self.hass.states.get(self._source_entity)
-
         if not source_state:
             # Source entity doesn't exist (should never happen after setup)
             if self._last_source_state != "missing":
@@ -142,34 +165,46 @@ class EVSOCMonitor:
                 )
                 self._last_source_state = source_state.state
 
-    def _is_valid_state(self, state) -> bool:
+    @staticmethod
+    def _is_valid_state(state) -> bool:
         """Check if state is valid (not unknown/unavailable/None)."""
-        if not state:
-            return False
-        if state.state in [None, "unknown", "unavailable", "none"]:
-            return False
-        return True
+        return state is not None and state.state not in _INVALID_STATES
 
     async def _update_cache(self, value: float):
-        """Update cached sensor with new valid value (silent operation)."""
-        self._last_valid_value = value
-        self._last_valid_time = dt_util.now()
+        """Update cached sensor with new valid value (silent operation).
+
+        An unchanged value is not written again until the refresh interval
+        has passed: every write is a state change for listeners and recorder.
+        Meanwhile _last_valid_time and last_valid_update keep the time of the
+        last write, not of the last confirming read.
+        """
+        now = dt_util.now()
+        if (
+            value == self._last_valid_value
+            and self._last_valid_time is not None
+            and (now - self._last_valid_time).total_seconds()
+            < EV_SOC_CACHE_REFRESH_INTERVAL
+        ):
+            return
 
-        # Calculate cache age for diagnostics
-        cache_age_seconds = 0  # Just updated
+        self._last_valid_value = value
+        self._last_valid_time = now
 
         if self._cache_sensor and hasattr(self._cache_sensor, "async_publish_cache"):
             await self._cache_sensor.async_publish_cache(
                 value,
-                last_valid_update=self._last_valid_time,
+                last_valid_update=now,
                 is_cached=False,
-                cache_age_seconds=cache_age_seconds,
+                cache_age_seconds=0,  # Just updated
             )
             return
         self.logger.warning("Cached EV SOC entity object not registered in runtime data")
 
     async def async_remove(self):
-        """Cleanup: cancel timer."""
+        """Cleanup: stop tracking the source sensor and cancel timer."""
+        if self._state_unsub:
+            self._state_unsub()
+            self._state_unsub = None
         if self._timer_unsub:
             self._timer_unsub()
             self._timer_unsub = None
@@ -6,15 +6,26 @@ Restructured logging with date-based directory organization:
 - Automatic daily file rotation at midnight
 """
 from __future__ import annotations
+import asyncio
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.util import dt as dt_util
 
-from .const import HELPER_ENABLE_FILE_LOGGING_SUFFIX
+from .const import (
+    HELPER_ENABLE_FILE_LOGGING_SUFFIX,
+    LOG_FILE_FLUSH_INTERVAL,
+    LOG_TOGGLE_DEBOUNCE,
+)
 from .runtime import EVSCRuntimeData
 from .utils.logging_helper import EVSCLogger
 
@@ -30,6 +41,7 @@ class LogManager:
     - Enables/disables one global file handler shared by all EVSC component loggers
     - Manages date-based log file paths (year/month/day.log)
     - Handles automatic daily file rotation at midnight
+    - Flushes the buffered file handler every LOG_FILE_FLUSH_INTERVAL seconds
     """
 
     def __init__(
@@ -59,9 +71,13 @@ class LogManager:
         self._toggle_entity = None  # Toggle switch entity ID
         self._state_listener_unsub = None  # State change listener
         self._midnight_listener_unsub = None  # Midnight rotation listener
+        self._flush_listener_unsub = None  # Periodic buffered-log flush
+        self._flush_job = None  # In-flight flush, awaited before closing
+        self._apply_unsub = None  # Pending debounced toggle application
         self._current_date = None  # Track current log date
+        self._current_log_path = None  # Path for _current_date, set with it
 
-        _LOGGER.info(f"LogManager initialized - Logs base path: {self._logs_base_path}")
+        _LOGGER.info("LogManager initialized - Logs base path: %s", self._logs_base_path)
 
     def _get_log_file_path_for_date(self, date_value: datetime) -> str:
         """
@@ -94,8 +110,8 @@ class LogManager:
         Returns:
             Full path to today's log file
         """
-        if self._current_date is not None:
-            return self._get_log_file_path_for_date(self._current_date)
+        if self._current_log_path is not None:
+            return self._current_log_path
         return self._get_log_file_path_for_date(dt_util.now())
 
     def get_logs_directory(self) -> str:
@@ -115,15 +131,17 @@ class LogManager:
             components: List of EVSCLogger instances from all components
         """
         self._current_date = dt_util.now().date()
-        _LOGGER.info(f"LogManager setup with {len(components)} component loggers")
+        self._current_log_path = self._get_log_file_path_for_date(self._current_date)
+        _LOGGER.info("LogManager setup with %d component loggers", len(components))
 
         if self._runtime_data is not None:
             self._toggle_entity = self._runtime_data.get_entity_id(HELPER_ENABLE_FILE_LOGGING_SUFFIX)
 
         # Compatibility fallback for standalone tests only.
         # Production code paths must resolve integration entities via runtime_data.
+        # The toggle is a switch, so only the switch domain index is scanned.
         if not self._toggle_entity and self._runtime_data is None:
-            for entity_id in self.hass.states.async_entity_ids():
+            for entity_id in self.hass.states.async_entity_ids("switch"):
                 if entity_id.endswith(HELPER_ENABLE_FILE_LOGGING_SUFFIX):
                     self._toggle_entity = entity_id
                     _LOGGER.warning(
@@ -133,10 +151,10 @@ class LogManager:
                     break
 
         if self._toggle_entity:
-            _LOGGER.info(f"Found toggle entity: {self._toggle_entity}")
+            _LOGGER.info("Found toggle entity: %s", self._toggle_entity)
 
         if not self._toggle_entity:
-            _LOGGER.warning(f"Toggle entity '{HELPER_ENABLE_FILE_LOGGING_SUFFIX}' not found")
+            _LOGGER.warning("Toggle entity '%s' not found", HELPER_ENABLE_FILE_LOGGING_SUFFIX)
             return
 
         # Apply initial state (enable/disable based on current toggle)
@@ -160,8 +178,16 @@ class LogManager:
         )
         _LOGGER.info("Midnight listener registered for daily log rotation")
 
+        # Write out buffered records periodically (rotation and removal
+        # close the handler, which flushes it too)
+        self._flush_listener_unsub = async_track_time_interval(
+            self.hass,
+            self._async_flush_file_log,
+            timedelta(seconds=LOG_FILE_FLUSH_INTERVAL),
+        )
+
     @callback
-    async def _toggle_changed(self, event):
+    def _toggle_changed(self, event) -> None:
         """Handle toggle state change event."""
         old_state = event.data.get("old_state")
         new_state = event.data.get("new_state")
@@ -169,14 +195,29 @@ class LogManager:
         if not new_state:
             return
 
+        # Attribute-only updates do not change what should be applied
+        if old_state is not None and old_state.state == new_state.state:
+            return
+
         old_value = old_state.state if old_state else "unknown"
         new_value = new_state.state
 
-        _LOGGER.info(f"Toggle state changed: {old_value} → {new_value}")
+        _LOGGER.info("Toggle state changed: %s → %s", old_value, new_value)
+
+        # Restart the debounce window so only the settled state is applied
+        if self._apply_unsub:
+            self._apply_unsub()
+        self._apply_unsub = async_call_later(
+            self.hass, LOG_TOGGLE_DEBOUNCE, self._async_apply_debounced
+        )
+
+    async def _async_apply_debounced(self, _now: datetime) -> None:
+        """Apply the toggle state once it has stopped changing."""
+        self._apply_unsub = None
         await self._apply_logging_state()
 
     @callback
-    async def _handle_midnight(self, now: datetime):
+    def _handle_midnight(self, now: datetime) -> None:
         """
         Handle midnight transition - rotate to new daily log file.
 
@@ -188,20 +229,37 @@ class LogManager:
         if new_date == self._current_date:
             return  # Already on correct date
 
-        _LOGGER.info(f"Midnight rotation: {self._current_date} → {new_date}")
+        _LOGGER.info("Midnight rotation: %s → %s", self._current_date, new_date)
         self._current_date = new_date
+        self._current_log_path = self._get_log_file_path_for_date(new_date)
 
         # Check if logging is enabled
         state = self.hass.states.get(self._toggle_entity)
-        if state and state.state == "on":
-            # Re-enable with new day's file
-            new_log_path = self.get_log_file_path()
-            _LOGGER.info(f"Rotating to new log file: {new_log_path}")
-            await self.hass.async_add_executor_job(EVSCLogger.disable_global_file_logging)
-            await self.hass.async_add_executor_job(
-                EVSCLogger.enable_global_file_logging,
-                new_log_path,
-            )
+        if state and state.state == STATE_ON:
+            self.hass.async_create_task(self._async_rotate_log_file())
+
+    async def _async_rotate_log_file(self) -> None:
+        """Re-enable file logging on the current day's file."""
+        new_log_path = self.get_log_file_path()
+        _LOGGER.info("Rotating to new log file: %s", new_log_path)
+        # Enabling a different path swaps the handler under the helper's lock,
+        # so no separate disable hop (and no unlogged gap) is needed
+        await self.hass.async_add_executor_job(
+            EVSCLogger.enable_global_file_logging,
+            new_log_path,
+        )
+
+    async def _async_flush_file_log(self, _now: datetime | None = None) -> None:
+        """Write buffered log records to the current file (off the event loop)."""
+        self._flush_job = self.hass.async_add_executor_job(
+            EVSCLogger.flush_global_file_logging
+        )
+        try:
+            await self._flush_job
+        except OSError as err:
+            _LOGGER.warning("Failed to flush EVSC log file: %s", err)
+        finally:
+            self._flush_job = None
 
     async def _apply_logging_state(self):
         """Enable or disable file logging based on toggle state."""
@@ -211,12 +269,12 @@ class LogManager:
             _LOGGER.warning("Toggle state unavailable")
             return
 
-        enabled = state.state == "on"
+        enabled = state.state == STATE_ON
 
         if enabled:
             log_path = self.get_log_file_path()
             _LOGGER.info("Enabling global file logging for EVSC components")
-            _LOGGER.info(f"Log file: {log_path}")
+            _LOGGER.info("Log file: %s", log_path)
             await self.hass.async_add_executor_job(
                 EVSCLogger.enable_global_file_logging,
                 log_path,
@@ -239,6 +297,20 @@ class LogManager:
             self._midnight_listener_unsub()
             self._midnight_listener_unsub = None
 
+        # Drop a pending toggle application
+        if self._apply_unsub:
+            self._apply_unsub()
+            self._apply_unsub = None
+
+        # Remove periodic flush listener
+        if self._flush_listener_unsub:
+            self._flush_listener_unsub()
+            self._flush_listener_unsub = None
+
+        # Let an in-flight flush finish before the handler is closed
+        if self._flush_job is not None:
+            await asyncio.gather(self._flush_job, return_exceptions=True)
+
         # Disable global file logging handler
         EVSCLogger.disable_global_file_logging()
 
@@ -36,13 +36,7 @@ from .const import (
     HELPER_HOME_BATTERY_MIN_SOC_SUFFIX,
     HELPER_GRID_IMPORT_THRESHOLD_SUFFIX,
     HELPER_GRID_IMPORT_DELAY_SUFFIX,
-    HELPER_CAR_READY_MONDAY_SUFFIX,
-    HELPER_CAR_READY_TUESDAY_SUFFIX,
-    HELPER_CAR_READY_WEDNESDAY_SUFFIX,
-    HELPER_CAR_READY_THURSDAY_SUFFIX,
-    HELPER_CAR_READY_FRIDAY_SUFFIX,
-    HELPER_CAR_READY_SATURDAY_SUFFIX,
-    HELPER_CAR_READY_SUNDAY_SUFFIX,
+    CAR_READY_SUFFIX_BY_WEEKDAY,
     DEFAULT_CAR_READY_TIME,
     DEFAULT_EV_MIN_SOC_WEEKDAY,
     DEFAULT_EV_MIN_SOC_WEEKEND,
@@ -52,6 +46,7 @@ from .const import (
     NIGHT_CHARGE_START_RETRY_DELAYS,
     ACTIVATION_GRACE_BEFORE_MINUTES,
     ACTIVATION_GRACE_AFTER_MINUTES,
+    NIGHT_CHARGE_IDLE_WAKE_MARGIN_MINUTES,
     HELPER_NIGHT_SESSION_STATE_SUFFIX,
     has_home_battery,
 )
@@ -161,6 +156,7 @@ class NightSmartCharge:
         self._battery_monitor_unsub = None
         self._grid_monitor_unsub = None  # Grid charge monitoring timer (v1.3.17)
         self._intent_unsub = None  # User-intent (target/car_ready) listener (v2.9.0)
+        self._schedule_unsub = None  # Night charge time listener (clears _idle_until)
         # v2.2.0: debounce clock for the power-based grid-stop. Holds the time the
         # measured charging power first fell below the floor; a terminal stop only
         # fires once it has stayed low for CHARGING_POWER_GRACE_SECONDS (so the
@@ -213,6 +209,8 @@ class NightSmartCharge:
         self._activation_date = None  # Date when last activated (prevents re-activation same day)
         self._last_completion_date = None  # Date when last completed
         self._last_diagnostic_log_time = None  # For throttling diagnostic logs
+        # Idle fast path: no window check needed before this time (see _update_idle_until)
+        self._idle_until = None
         self._preserve_skip_announced = False
 
     @property
@@ -439,17 +437,7 @@ class NightSmartCharge:
         )
 
         # Discover car_ready switches for each day (v1.3.13+)
-        days_suffixes = [
-            HELPER_CAR_READY_MONDAY_SUFFIX,
-            HELPER_CAR_READY_TUESDAY_SUFFIX,
-            HELPER_CAR_READY_WEDNESDAY_SUFFIX,
-            HELPER_CAR_READY_THURSDAY_SUFFIX,
-            HELPER_CAR_READY_FRIDAY_SUFFIX,
-            HELPER_CAR_READY_SATURDAY_SUFFIX,
-            HELPER_CAR_READY_SUNDAY_SUFFIX,
-        ]
-
-        for idx, suffix in enumerate(days_suffixes):
+        for idx, suffix in enumerate(CAR_READY_SUFFIX_BY_WEEKDAY):
             entity = self._resolve_entity(suffix)
             if entity:
                 self._car_ready_entities[idx] = entity
@@ -498,7 +486,7 @@ class NightSmartCharge:
             self._charger_status_unsub = async_track_state_change_event(
                 self.hass,
                 self._charger_status,
-                self._async_charger_status_changed
+                self._charger_status_changed
             )
         else:
             self.logger.info(
@@ -524,6 +512,14 @@ class NightSmartCharge:
                 f"User-intent re-arm listener active on {len(intent_entities)} entities"
             )
 
+        # A schedule change invalidates the idle fast path
+        if self._night_charge_time_entity:
+            self._schedule_unsub = async_track_state_change_event(
+                self.hass,
+                self._night_charge_time_entity,
+                self._async_schedule_changed,
+            )
+
         self.logger.success("Night Smart Charge setup completed successfully")
         self.logger.info("Periodic check interval: 1 minute")
         self.logger.info("Late arrival detection: Enabled")
@@ -549,6 +545,8 @@ class NightSmartCharge:
             self._grid_monitor_unsub()
         if self._intent_unsub:
             self._intent_unsub()
+        if self._schedule_unsub:
+            self._schedule_unsub()
 
         self.logger.success("Night Smart Charge removed")
 
@@ -577,6 +575,7 @@ class NightSmartCharge:
         """Force an immediate evaluation cycle."""
         if reason:
             self.logger.info(f"Immediate Night Smart Charge check requested: {reason}")
+        self._idle_until = None
         await self._async_periodic_check(dt_util.now())
 
     async def async_pause_for_external_override(self, reason: str = "") -> None:
@@ -765,9 +764,14 @@ class NightSmartCharge:
             self.logger.debug("Night Smart Charge disabled, skipping")
             return
 
+        # Idle fast path: nothing can activate before the next window approaches
+        if self._idle_until is not None and current_time < self._idle_until:
+            return
+
         # Check if we're in active window
         if not await self._is_in_active_window(current_time):
             self.logger.debug("Not in active window, skipping")
+            self._update_idle_until(current_time)
             return
 
         # Run evaluation
@@ -775,30 +779,82 @@ class NightSmartCharge:
         self.logger.start(f"Night charge evaluation at {current_time.strftime('%H:%M:%S')}")
         await self._evaluate_and_charge()
 
+    def _update_idle_until(self, now: datetime) -> None:
+        """Skip window checks until shortly before the next activation window.
+
+        Only set while the session is idle ("ready", nothing running): the
+        next window then opens at today's scheduled time if it is still
+        ahead, otherwise at tomorrow's. Cleared when the schedule changes or
+        an immediate check is requested.
+        """
+        self._idle_until = None
+        if self._session_state != "ready" or self.is_active():
+            return
+        if not self._night_charge_time_entity:
+            return
+
+        time_state = state_helper.get_state(self.hass, self._night_charge_time_entity)
+        if not time_state or time_state in ("unknown", "unavailable"):
+            return
+
+        try:
+            scheduled_time = self._get_scheduled_time_for_today(now, time_state)
+            if now >= scheduled_time:
+                scheduled_time = self._get_scheduled_time_for_today(
+                    now + timedelta(days=1), time_state
+                )
+        except (ValueError, TypeError, IndexError):
+            return
+
+        self._idle_until = scheduled_time - timedelta(
+            minutes=ACTIVATION_GRACE_BEFORE_MINUTES + NIGHT_CHARGE_IDLE_WAKE_MARGIN_MINUTES
+        )
+
     @callback
-    async def _async_charger_status_changed(self, event) -> None:
-        """Handle charger status changes for late arrival detection."""
+    def _async_schedule_changed(self, event) -> None:
+        """Drop the idle fast path when the night charge time changes."""
+        self._idle_until = None
+
+    @staticmethod
+    def _is_plug_in_event(event) -> bool:
+        """Return True when a charger status event is a car plug-in.
+
+        v2.9.1: brand-vocabulary aware — the old exact 'charger_free'
+        comparison never fired on wallboxes reporting e.g. 'available'.
+        """
         new_state: State = event.data.get("new_state")
         old_state: State = event.data.get("old_state")
 
         if not new_state or not old_state:
-            return
+            return False
 
-        # Detect car just plugged in (from a disconnected status to any other).
-        # v2.9.1: brand-vocabulary aware — the old exact 'charger_free'
-        # comparison never fired on wallboxes reporting e.g. 'available'.
-        if is_disconnected_status(old_state.state) and not is_disconnected_status(
+        # From a disconnected status to any other
+        return is_disconnected_status(old_state.state) and not is_disconnected_status(
             new_state.state
-        ):
-            self.logger.info(f"{self.logger.EV} Car plugged in (status: {new_state.state})")
+        )
 
-            # Check if we're in active window and enabled
-            now = dt_util.now()
-            if self._boost_charge and self._boost_charge.is_active():
-                self.logger.info("Boost Charge active - skipping late arrival handling")
-            elif await self._is_in_active_window(now) and self.is_enabled():
-                self.logger.info("Late arrival detected - running immediate check")
-                await self._evaluate_and_charge()
+    @callback
+    def _charger_status_changed(self, event) -> None:
+        """Filter charger status events; only plug-ins schedule any work.
+
+        Most status updates (attribute refreshes, charging → charged, ...) are
+        dropped here without creating a task.
+        """
+        if self._is_plug_in_event(event):
+            self.hass.async_create_task(self._async_charger_status_changed(event))
+
+    async def _async_charger_status_changed(self, event) -> None:
+        """Handle a car plug-in (already filtered by _charger_status_changed)."""
+        new_state: State = event.data["new_state"]
+        self.logger.info(f"{self.logger.EV} Car plugged in (status: {new_state.state})")
+
+        # Check if we're in active window and enabled
+        now = dt_util.now()
+        if self._boost_charge and self._boost_charge.is_active():
+            self.logger.info("Boost Charge active - skipping late arrival handling")
+        elif await self._is_in_active_window(now) and self.is_enabled():
+            self.logger.info("Late arrival detected - running immediate check")
+            await self._evaluate_and_charge()
 
     async def _async_user_intent_changed(self, event) -> None:
         """Re-arm a completed session when the user changes today's intent (v2.9.0).
@@ -875,6 +931,7 @@ class NightSmartCharge:
         self._session_state = "ready"
         self._last_completion_time = None
         self._last_completion_date = None
+        self._idle_until = None
 
     # ========== ACTIVE WINDOW DETECTION ==========
 
@@ -997,20 +1054,24 @@ class NightSmartCharge:
             or (now - self._last_diagnostic_log_time).total_seconds() >= 60
         )
         if (is_active or approaching) and throttle_ok:
+            # One record per check: the block repeats every minute near the
+            # window, and each logger call is a separate handler dispatch.
             self.logger.separator()
-            self.logger.info(f"{self.logger.CALENDAR} 🔍 WINDOW CHECK DIAGNOSTIC")
-            self.logger.info(f"   Current: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"   Scheduled (today): {scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"   Grace window: [{grace_start.strftime('%H:%M')} - {grace_end.strftime('%H:%M')}]")
-            self.logger.info(f"   Sunrise: {sunrise.strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"   Session state: {self._session_state}")
-            self.logger.info(f"   Last activation date: {self._activation_date}")
-            self.logger.info(f"   Last completion date: {self._last_completion_date}")
-            self.logger.info("   ─────────────────────")
-            self.logger.info(f"   In grace window: {in_grace}")
-            self.logger.info(f"   Past scheduled: {past_scheduled}")
-            self.logger.info(f"   Before sunrise: {before_sunrise}")
-            self.logger.info(f"   Window ACTIVE: {is_active}")
+            self.logger.info(
+                f"{self.logger.CALENDAR} 🔍 WINDOW CHECK DIAGNOSTIC\n"
+                f"   Current: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"   Scheduled (today): {scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"   Grace window: [{grace_start.strftime('%H:%M')} - {grace_end.strftime('%H:%M')}]\n"
+                f"   Sunrise: {sunrise.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"   Session state: {self._session_state}\n"
+                f"   Last activation date: {self._activation_date}\n"
+                f"   Last completion date: {self._last_completion_date}\n"
+                "   ─────────────────────\n"
+                f"   In grace window: {in_grace}\n"
+                f"   Past scheduled: {past_scheduled}\n"
+                f"   Before sunrise: {before_sunrise}\n"
+                f"   Window ACTIVE: {is_active}"
+            )
             self.logger.separator()
             self._last_diagnostic_log_time = now
         else:
@@ -153,7 +153,7 @@ class ChargingModel:
 
     phase_count: int
     effective_voltage: float
-    amp_levels: list[int]
+    amp_levels: tuple[int, ...]
     charger_model: str
     _production_entities: list[str]
     _consumption_entities: list[str]
@@ -11,6 +11,8 @@ from .const import (
     DEFAULT_EV_MIN_SOC_WEEKDAY,
     DEFAULT_EV_MIN_SOC_WEEKEND,
     DEFAULT_HOME_MIN_SOC,
+    EV_MIN_SOC_SUFFIX_BY_WEEKDAY,
+    HOME_MIN_SOC_SUFFIX_BY_WEEKDAY,
     HELPER_PRIORITY_BALANCER_ENABLED_SUFFIX,
     HELPER_TODAY_EV_TARGET_SUFFIX,
     HELPER_TODAY_HOME_TARGET_SUFFIX,
@@ -104,13 +106,10 @@ class PriorityBalancer:
         # Discover daily SOC target entities
         days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
 
-        for day in days:
-            # EV targets
-            ev_suffix = f"evsc_ev_min_soc_{day}"
+        for day, ev_suffix, home_suffix in zip(
+            days, EV_MIN_SOC_SUFFIX_BY_WEEKDAY, HOME_MIN_SOC_SUFFIX_BY_WEEKDAY
+        ):
             self._ev_min_soc_entities[day] = resolve_entity(ev_suffix)
-
-            # Home targets
-            home_suffix = f"evsc_home_min_soc_{day}"
             self._home_min_soc_entities[day] = resolve_entity(home_suffix)
 
         # Discover cached EV SOC sensor (v1.4.0)
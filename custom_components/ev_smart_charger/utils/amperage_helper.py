@@ -4,7 +4,7 @@ This module provides reusable utilities for dynamic amperage management
 used by both Solar Surplus and Night Smart Charge components.
 """
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 from homeassistant.util import dt as dt_util
 
@@ -24,7 +24,7 @@ class AmperageCalculator:
         surplus_watts: float,
         current_amps: int = 0,
         battery_support_amps: Optional[int] = None,
-        amp_levels: Optional[list] = None,
+        amp_levels: Optional[Sequence[int]] = None,
         voltage: Optional[float] = None,
     ) -> Tuple[int, str]:
         """Calculate target amperage from surplus with battery support fallback.
@@ -90,7 +90,7 @@ class AmperageCalculator:
         return 0, f"Insufficient surplus ({surplus_amps:.1f}A < {SURPLUS_STOP_THRESHOLD}A)"
 
     @staticmethod
-    def get_next_level_down(current_amps: int, amp_levels: Optional[list] = None) -> int:
+    def get_next_level_down(current_amps: int, amp_levels: Optional[Sequence[int]] = None) -> int:
         """Calculate one level down for reduction (grid import protection).
 
         Args:
@@ -118,7 +118,7 @@ class AmperageCalculator:
 
     @staticmethod
     def get_next_level_up(
-        current_amps: int, max_amps: int, amp_levels: Optional[list] = None
+        current_amps: int, max_amps: int, amp_levels: Optional[Sequence[int]] = None
     ) -> int:
         """Calculate one level up for recovery (gradual ramp-up).
 
@@ -1,10 +1,13 @@
 """Astral Time Service for centralized sunset/sunrise calculations."""
 from __future__ import annotations
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.sun import get_astral_event_date
 from homeassistant.util import dt as dt_util
 
+# Enough for the yesterday/today/tomorrow lookups the callers make
+_EVENT_CACHE_MAX_SIZE = 16
+
 
 class AstralTimeService:
     """
@@ -22,6 +25,39 @@ class AstralTimeService:
             hass: Home Assistant instance
         """
         self.hass = hass
+        # (event, local date, latitude, longitude, elevation) -> event time
+        self._event_cache: dict[tuple, datetime | None] = {}
+
+    def _get_event(self, event: str, reference_date: datetime) -> datetime | None:
+        """Return an astral event for the local date of reference_date.
+
+        Results are cached per day: every periodic check asks for the same
+        few sunrises and sunsets, and each computation is trig-heavy.
+        """
+        local_date: date = (
+            dt_util.as_local(reference_date).date()
+            if isinstance(reference_date, datetime)
+            else reference_date
+        )
+        config = self.hass.config
+        key = (
+            event,
+            local_date,
+            config.latitude,
+            config.longitude,
+            config.elevation,
+        )
+        try:
+            return self._event_cache[key]
+        except KeyError:
+            pass
+
+        if len(self._event_cache) >= _EVENT_CACHE_MAX_SIZE:
+            self._event_cache.clear()
+        result = self._event_cache[key] = get_astral_event_date(
+            self.hass, event, reference_date
+        )
+        return result
 
     def get_sunset(self, reference_date: datetime = None) -> datetime | None:
         """
@@ -41,7 +77,7 @@ class AstralTimeService:
         if reference_date is None:
             reference_date = dt_util.now()
 
-        return get_astral_event_date(self.hass, "sunset", reference_date)
+        return self._get_event("sunset", reference_date)
 
     def get_sunrise(self, reference_date: datetime = None) -> datetime | None:
         """
@@ -61,7 +97,7 @@ class AstralTimeService:
         if reference_date is None:
             reference_date = dt_util.now()
 
-        return get_astral_event_date(self.hass, "sunrise", reference_date)
+        return self._get_event("sunrise", reference_date)
 
     def get_today_sunset(self) -> datetime | None:
         """Get today's sunset time."""
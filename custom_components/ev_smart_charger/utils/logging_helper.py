@@ -21,6 +21,29 @@ _EVENT_COUNTER = count(1)
 _EVENT_COUNTER_LOCK = threading.Lock()
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves INFO/DEBUG records in the file buffer.
+
+    StreamHandler flushes after every record; here only WARNING and above are
+    flushed immediately, so a crash can lose at most the routine records
+    since the last flush. Everything else is written out by flush(), which
+    LogManager calls periodically, or by close().
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing only for warnings and errors."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class EVSCLogger:
     """Standardized logging for EVSC components."""
 
@@ -110,21 +133,29 @@ class EVSCLogger:
 
     def separator(self, length: int = 64):
         """Log visual separator."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(self.SEPARATOR * length)
 
     def info(self, message: str, *args):
         """Log info message."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         if args:
             message = message % args
         _LOGGER.info(f"{self.INFO} [{self.component}] {message}")
 
     def decision(self, decision_type: str, decision: str, reason: str):
         """Log a decision with reason."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(f"{self.DECISION} [{self.component}] Decision: {decision}")
         _LOGGER.info(f"   Reason: {reason}")
 
     def action(self, action: str, details: str = ""):
         """Log an action."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         msg = f"{self.ACTION} [{self.component}] Action: {action}"
         if details:
             msg += f" - {details}"
@@ -132,6 +163,8 @@ class EVSCLogger:
 
     def success(self, message: str, *args):
         """Log success."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         if args:
             message = message % args
         _LOGGER.info(f"{self.SUCCESS} [{self.component}] {message}")
@@ -150,14 +183,20 @@ class EVSCLogger:
 
     def skip(self, reason: str):
         """Log skip with reason."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(f"{self.SKIP} [{self.component}] Skipped: {reason}")
 
     def start(self, process: str):
         """Log process start."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(f"{self.START} [{self.component}] Starting: {process}")
 
     def stop(self, process: str, reason: str = ""):
         """Log process stop."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         msg = f"{self.STOP} [{self.component}] Stopping: {process}"
         if reason:
             msg += f" - Reason: {reason}"
@@ -165,12 +204,16 @@ class EVSCLogger:
 
     def state_change(self, entity: str, old_state: str, new_state: str):
         """Log state change."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(
             f"{self.INFO} [{self.component}] State change: {entity} ({old_state} → {new_state})"
         )
 
     def sensor_value(self, sensor_name: str, value: any, unit: str = ""):
         """Log sensor value."""
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         msg = f"{self.INFO} [{self.component}] {sensor_name}: {value}"
         if unit:
             msg += f" {unit}"
@@ -178,6 +221,8 @@ class EVSCLogger:
 
     def debug(self, message: str, *args):
         """Log debug message."""
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
         if args:
             message = message % args
         _LOGGER.debug(f"{self.TRACE} [{self.component}] {message}")
@@ -258,7 +303,7 @@ class EVSCLogger:
     @classmethod
     def _build_file_handler(cls, log_file_path: str) -> logging.FileHandler:
         """Create configured file handler for EVSC daily logging."""
-        handler = logging.FileHandler(
+        handler = _BufferedFileHandler(
             log_file_path,
             mode="a",
             encoding="utf-8",
@@ -320,6 +365,13 @@ class EVSCLogger:
             _GLOBAL_FILE_HANDLER_PATH = None
             return True
 
+    @classmethod
+    def flush_global_file_logging(cls) -> None:
+        """Write buffered records of the global file handler to disk."""
+        with _GLOBAL_FILE_HANDLER_LOCK:
+            if _GLOBAL_FILE_HANDLER:
+                _GLOBAL_FILE_HANDLER.flush()
+
     @classmethod
     def is_global_file_logging_enabled(cls) -> bool:
         """Check whether global file logging is enabled."""
@@ -1,19 +1,27 @@
 """Tests for ChargerController."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from homeassistant.util import dt as dt_util
 
-from custom_components.ev_smart_charger.charger_controller import ChargerController
+from custom_components.ev_smart_charger.charger_controller import (
+    _ENTITY_LOCKS_KEY,
+    ChargerController,
+)
 from custom_components.ev_smart_charger.const import (
+    CHARGER_AMPERAGE_STABILIZATION_DELAY,
     CHARGER_MIN_OPERATION_INTERVAL,
+    CHARGER_START_SEQUENCE_DELAY,
     CONF_EV_CHARGER_CURRENT,
     CONF_EV_CHARGER_SWITCH,
+    DOMAIN,
 )
 
+_REAL_SLEEP = asyncio.sleep
+
 
 @pytest.fixture
 def service_recorder(hass):
@@ -68,6 +76,43 @@ def controller_factory(hass, service_recorder):
     return _build
 
 
+@pytest.fixture
+async def rate_limited_controller(hass, controller_factory):
+    """Yield a controller builder and the event gating rate-limit waits.
+
+    ``await build(switch_state, current_state)`` returns a set-up controller
+    whose rate-limit deadline is armed. While the fixture is active, sleeps
+    of at least half the interval (the rate-limit wait) block until
+    ``release`` is set; shorter sequence delays return immediately.
+    """
+    release = asyncio.Event()
+
+    async def gated_sleep(delay):
+        if delay >= CHARGER_MIN_OPERATION_INTERVAL / 2:
+            await release.wait()
+
+    async def build(switch_state: str, current_state: str) -> ChargerController:
+        hass.states.async_set("switch.charger", switch_state)
+        hass.states.async_set("number.charger_current", current_state)
+        controller = controller_factory()
+        await controller.async_setup()
+        # The rate limit is a deadline on the event-loop clock.
+        controller._next_operation_at = (
+            hass.loop.time() + CHARGER_MIN_OPERATION_INTERVAL
+        )
+        return controller
+
+    with patch("asyncio.sleep", new=gated_sleep):
+        yield build, release
+        release.set()
+
+
+async def _run_pending_tasks(rounds: int) -> None:
+    """Let scheduled tasks advance, even while asyncio.sleep is patched."""
+    for _ in range(rounds):
+        await _REAL_SLEEP(0)
+
+
 async def test_initial_state(hass, controller_factory):
     """Controller reads initial switch and current state."""
     hass.states.async_set("switch.charger", "off")
@@ -98,7 +143,32 @@ async def test_start_charger_with_number_control(hass, controller_factory, servi
         ("number", "set_value", {"entity_id": "number.charger_current", "value": 16}),
         ("switch", "turn_on", {"entity_id": "switch.charger"}),
     ]
-    assert sleep_mock.await_count >= 2
+    # Cold start: set and turn_on share one settle delay instead of two.
+    sleep_mock.assert_awaited_once_with(
+        max(CHARGER_AMPERAGE_STABILIZATION_DELAY, CHARGER_START_SEQUENCE_DELAY)
+    )
+
+
+async def test_noop_start_and_stop_issue_no_commands(
+    hass,
+    controller_factory,
+    service_recorder,
+):
+    """Start/stop matching the cached state skip the service round-trip."""
+    hass.states.async_set("switch.charger", "on")
+    hass.states.async_set("number.charger_current", "16")
+    controller = controller_factory()
+    await controller.async_setup()
+
+    start_result = await controller.start_charger(16, reason="Already on")
+    controller._is_on = False
+    stop_result = await controller.stop_charger(reason="Already off")
+
+    assert start_result.success is True
+    assert start_result.amperage == 16
+    assert stop_result.success is True
+    assert service_recorder == []
+    assert controller._next_operation_at == 0.0
 
 
 async def test_set_amperage_decrease_uses_safe_sequence(
@@ -124,19 +194,40 @@ async def test_set_amperage_decrease_uses_safe_sequence(
     ]
 
 
-async def test_rate_limiting_waits_instead_of_queue(
+async def test_state_readers_not_blocked_during_decrease(
     hass,
     controller_factory,
     service_recorder,
 ):
-    """Second operation waits for the rate limit and never returns queued."""
-    hass.states.async_set("switch.charger", "off")
-    hass.states.async_set("number.charger_current", "6")
+    """Readers observe the decrease sequence without waiting on the lock."""
+    hass.states.async_set("switch.charger", "on")
+    hass.states.async_set("number.charger_current", "16")
     controller = controller_factory()
     await controller.async_setup()
-    # Must be timezone-aware: the controller computes the rate-limit delta with
-    # dt_util.now() (aware); a naive datetime.now() raises on the subtraction.
-    controller._last_operation_time = dt_util.now()
+
+    observed = []
+
+    async def fake_sleep(delay):
+        observed.append(
+            (await controller.is_charging(), await controller.get_current_amperage())
+        )
+
+    with patch("asyncio.sleep", new=fake_sleep):
+        result = await controller.set_amperage(6, reason="Decrease")
+
+    assert result.operation == "adjust_down"
+    assert observed[0] == (False, 16)
+    assert observed[-1] == (True, 6)
+
+
+async def test_rate_limiting_waits_instead_of_queue(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """Second operation waits for the rate limit and never returns queued."""
+    build, _ = rate_limited_controller
+    controller = await build("off", "6")
 
     with patch("asyncio.sleep", new=AsyncMock()) as sleep_mock:
         result = await controller.start_charger(10, reason="Rate limited")
@@ -153,6 +244,72 @@ async def test_rate_limiting_waits_instead_of_queue(
     ]
 
 
+async def test_rate_limit_wait_does_not_hold_lock(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """A caller waiting out the rate limit leaves the lock free for others."""
+    build, release = rate_limited_controller
+    controller = await build("off", "6")
+
+    task = asyncio.create_task(controller.start_charger(10, reason="Waiting"))
+    await _run_pending_tasks(3)
+    assert controller._lock.locked() is False
+    release.set()
+    result = await task
+
+    assert result.success is True
+    assert ("switch", "turn_on", {"entity_id": "switch.charger"}) in service_recorder
+
+
+async def test_waiting_set_amperage_is_superseded_by_newer_target(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """Only the latest amperage target runs after a rate-limit wait."""
+    build, release = rate_limited_controller
+    controller = await build("off", "6")
+
+    first = asyncio.create_task(controller.set_amperage(10, reason="First"))
+    await _run_pending_tasks(3)
+    second = asyncio.create_task(controller.set_amperage(13, reason="Second"))
+    await _run_pending_tasks(3)
+    release.set()
+    first_result = await first
+    second_result = await second
+
+    assert first_result.success is True
+    assert first_result.reason.startswith("Superseded")
+    assert second_result.amperage == 13
+    assert [call for call in service_recorder if call[0] == "number"] == [
+        ("number", "set_value", {"entity_id": "number.charger_current", "value": 13}),
+    ]
+
+
+async def test_superseded_waiter_wakes_before_deadline(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """A newer request wakes a superseded waiter instead of letting it sleep on."""
+    build, release = rate_limited_controller
+    controller = await build("off", "6")
+
+    first = asyncio.create_task(controller.set_amperage(10, reason="First"))
+    await _run_pending_tasks(3)
+    second = asyncio.create_task(controller.set_amperage(13, reason="Second"))
+    await _run_pending_tasks(5)
+
+    assert first.done()
+    assert first.result().reason.startswith("Superseded")
+    assert not second.done()
+
+    release.set()
+    await second
+
+
 @pytest.mark.parametrize(
     ("entity_id", "expected_service_domain", "expected_service", "expected_field", "expected_value"),
     [
@@ -212,6 +369,168 @@ async def test_adjust_and_recover_do_not_deadlock(
     assert ("number", "set_value", {"entity_id": "number.charger_current", "value": 16}) in service_recorder
 
 
+async def test_external_state_changes_update_cache(hass, controller_factory):
+    """Changes made outside the controller are tracked without polling."""
+    hass.states.async_set("switch.charger", "off")
+    hass.states.async_set("number.charger_current", "6")
+    controller = controller_factory()
+    await controller.async_setup()
+
+    hass.states.async_set("switch.charger", "on")
+    hass.states.async_set("number.charger_current", "13")
+    await hass.async_block_till_done()
+
+    assert controller._is_on is True
+    assert controller._current_amperage == 13
+
+    await controller.async_remove()
+    hass.states.async_set("number.charger_current", "16")
+    await hass.async_block_till_done()
+
+    assert controller._current_amperage == 13
+
+
+async def test_remove_releases_rate_limited_requests(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """Removing the controller drops requests still waiting on the rate limit."""
+    build, _ = rate_limited_controller
+    controller = await build("off", "6")
+
+    pending = asyncio.create_task(controller.set_amperage(13, reason="Late"))
+    await _run_pending_tasks(3)
+
+    await controller.async_remove()
+    result = await asyncio.wait_for(pending, timeout=1)
+
+    assert result.success is False
+    assert result.error_message == "Charger controller removed"
+    assert controller._pending_requests == 0
+    assert [call for call in service_recorder if call[0] == "number"] == []
+
+
+async def test_set_amperage_noop_skips_rate_limit_when_idle(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """A request for the current amperage returns without waiting when idle."""
+    build, _ = rate_limited_controller
+    controller = await build("on", "16")
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep_mock:
+        set_result = await controller.set_amperage(16, reason="Same target")
+        recover_result = await controller.recover_to_target(13, reason="Above target")
+
+    sleep_mock.assert_not_awaited()
+
+    assert set_result.success is True
+    assert set_result.amperage == 16
+    assert recover_result.success is True
+    assert recover_result.amperage == 16
+    assert service_recorder == []
+
+
+async def test_noop_request_supersedes_parked_request(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """A request for the cached amperage still supersedes a parked request."""
+    build, release = rate_limited_controller
+    controller = await build("on", "16")
+
+    parked = asyncio.create_task(controller.set_amperage(10, reason="Parked"))
+    await _run_pending_tasks(3)
+    latest = asyncio.create_task(controller.set_amperage(16, reason="Back to 16A"))
+    await _run_pending_tasks(5)
+
+    assert parked.done()
+    assert parked.result().reason.startswith("Superseded")
+
+    release.set()
+    result = await latest
+
+    assert result.success is True
+    assert result.amperage == 16
+    assert [call for call in service_recorder if call[0] == "number"] == []
+
+
+async def test_grid_import_adjust_skips_rate_limit(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """Grid-import protection sheds load without waiting for the rate limit."""
+    build, _ = rate_limited_controller
+    controller = await build("on", "16")
+
+    with patch("asyncio.sleep", new=AsyncMock()) as sleep_mock:
+        result = await controller.adjust_for_grid_import("Grid import high")
+
+    assert result.success is True
+    assert all(
+        call.args[0] < CHARGER_MIN_OPERATION_INTERVAL / 2
+        for call in sleep_mock.await_args_list
+    )
+    assert ("number", "set_value", {"entity_id": "number.charger_current", "value": 13}) in service_recorder
+
+
+async def test_grid_import_adjust_supersedes_parked_request(
+    hass,
+    rate_limited_controller,
+    service_recorder,
+):
+    """Grid-import protection drops an older amperage request still waiting."""
+    build, release = rate_limited_controller
+    controller = await build("on", "16")
+
+    parked = asyncio.create_task(controller.set_amperage(20, reason="Parked"))
+    await _run_pending_tasks(3)
+
+    result = await controller.adjust_for_grid_import("Grid import high")
+    await _run_pending_tasks(3)
+
+    assert parked.done()
+    assert parked.result().reason.startswith("Superseded")
+    release.set()
+
+    assert result.success is True
+    assert controller._next_operation_at > hass.loop.time()
+    assert [call for call in service_recorder if call[0] == "number"] == [
+        ("number", "set_value", {"entity_id": "number.charger_current", "value": 13})
+    ]
+
+
+async def test_entity_locks_are_dropped_with_last_controller(
+    hass,
+    controller_factory,
+    service_recorder,
+):
+    """Shared per-entity locks live only while a controller still uses them."""
+    hass.states.async_set("switch.charger", "off")
+    hass.states.async_set("number.charger_current", "6")
+    first = controller_factory()
+    second = controller_factory()
+    await first.async_setup()
+    await second.async_setup()
+
+    data = {"entity_id": "switch.charger"}
+    await first._call_service("switch", "turn_on", data)
+    await second._call_service("switch", "turn_off", data)
+
+    locks = hass.data[DOMAIN][_ENTITY_LOCKS_KEY]
+    assert set(locks) == {"switch.charger"}
+
+    await first.async_remove()
+    assert set(locks) == {"switch.charger"}
+
+    await second.async_remove()
+    assert _ENTITY_LOCKS_KEY not in hass.data[DOMAIN]
+
+
 async def test_service_error_is_reported(hass, controller_factory):
     """Service failures are surfaced in OperationResult."""
     hass.states.async_set("switch.charger", "on")
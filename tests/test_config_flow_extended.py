@@ -1,13 +1,19 @@
 """Additional tests for the EVSC config and options flow."""
 from __future__ import annotations
 
+import time
 from unittest.mock import patch
 
 import pytest
 from homeassistant import config_entries, data_entry_flow
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ev_smart_charger.config_flow import EVSCConfigFlow, EVSCOptionsFlow
+from custom_components.ev_smart_charger.config_flow import (
+    EVSCConfigFlow,
+    EVSCOptionsFlow,
+    _get_mobile_notify_services,
+    _notifications_schema,
+)
 from custom_components.ev_smart_charger.const import (
     CONF_BATTERY_CAPACITY,
     CONF_BATTERY_POWER,
@@ -133,10 +139,40 @@ async def test_mobile_notify_services_are_filtered_by_prefix(hass) -> None:
     hass.services.async_register("notify", "mobile_app_alice", lambda call: None)
     hass.services.async_register("notify", "notify_everyone", lambda call: None)
 
-    flow = EVSCConfigFlow()
-    flow.hass = hass
+    assert _get_mobile_notify_services(hass) == ("mobile_app_alice",)
+
+
+async def test_mobile_notify_services_are_cached_briefly(hass) -> None:
+    """Repeated renders reuse the scan until the short TTL expires."""
+    hass.services.async_register("notify", "mobile_app_alice", lambda call: None)
+
+    assert _get_mobile_notify_services(hass) == ("mobile_app_alice",)
+    hass.services.async_register("notify", "mobile_app_bob", lambda call: None)
+    assert _get_mobile_notify_services(hass) == ("mobile_app_alice",)
+
+    cache = hass.data[DOMAIN]
+    _, services = cache["_mobile_notify_services"]
+    cache["_mobile_notify_services"] = (time.monotonic() - 60, services)
+    assert _get_mobile_notify_services(hass) == (
+        "mobile_app_alice",
+        "mobile_app_bob",
+    )
+
+
+async def test_notifications_defaults_drop_unregistered_services(hass) -> None:
+    """Saved notify services that no longer exist are not prefilled."""
+    hass.services.async_register("notify", "mobile_app_alice", lambda call: None)
+
+    schema = _notifications_schema(
+        hass,
+        {
+            CONF_NOTIFY_SERVICES: ["mobile_app_alice", "mobile_app_gone"],
+            CONF_CAR_OWNER: "person.owner",
+        },
+    )
 
-    assert flow._get_mobile_notify_services() == ["mobile_app_alice"]
+    marker = next(key for key in schema.schema if key == CONF_NOTIFY_SERVICES)
+    assert marker.default() == ["mobile_app_alice"]
 
 
 async def test_options_flow_updates_entry_data(hass) -> None:
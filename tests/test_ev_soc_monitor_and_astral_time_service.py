@@ -4,7 +4,11 @@ from __future__ import annotations
 from datetime import datetime, time, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
-from custom_components.ev_smart_charger.const import CONF_SOC_CAR, HELPER_CACHED_EV_SOC_SUFFIX
+from custom_components.ev_smart_charger.const import (
+    CONF_SOC_CAR,
+    EV_SOC_CACHE_REFRESH_INTERVAL,
+    HELPER_CACHED_EV_SOC_SUFFIX,
+)
 from custom_components.ev_smart_charger.ev_soc_monitor import EVSOCMonitor
 from custom_components.ev_smart_charger.runtime import EVSCRuntimeData
 from custom_components.ev_smart_charger.utils.astral_time_service import AstralTimeService
@@ -56,13 +60,78 @@ async def test_ev_soc_monitor_publishes_valid_source_updates(hass):
     ):
         await monitor.async_setup()
 
-    await monitor._async_poll_source_sensor()
-
+    # Setup primes the cache from the current source state.
     cache_sensor.async_publish_cache.assert_awaited_once()
     assert monitor._last_valid_value == 55.0
     assert monitor._last_source_state == "valid"
 
 
+async def test_ev_soc_monitor_skips_unchanged_republish(hass):
+    """An unchanged SOC is not rewritten until the refresh interval passes."""
+    runtime_data = EVSCRuntimeData(config={}, expected_entity_count=0)
+    cache_sensor = AsyncMock()
+    runtime_data.entity_ids_by_key[HELPER_CACHED_EV_SOC_SUFFIX] = "sensor.evsc_cached_ev_soc"
+    runtime_data.entities_by_key[HELPER_CACHED_EV_SOC_SUFFIX] = cache_sensor
+    hass.states.async_set("sensor.ev_source_soc", "55")
+
+    monitor = EVSOCMonitor(
+        hass,
+        "entry-1",
+        {CONF_SOC_CAR: "sensor.ev_source_soc"},
+        runtime_data=runtime_data,
+    )
+
+    with patch(
+        "custom_components.ev_smart_charger.ev_soc_monitor.async_track_time_interval",
+        return_value=lambda: None,
+    ):
+        await monitor.async_setup()
+
+    primed_at = monitor._last_valid_time
+    await monitor._async_poll_source_sensor()
+    cache_sensor.async_publish_cache.assert_awaited_once()
+    # A skipped republish leaves the last-valid timestamp at the previous write
+    assert monitor._last_valid_time == primed_at
+
+    monitor._last_valid_time -= timedelta(seconds=EV_SOC_CACHE_REFRESH_INTERVAL)
+    await monitor._async_poll_source_sensor()
+    assert cache_sensor.async_publish_cache.await_count == 2
+
+
+async def test_ev_soc_monitor_follows_source_state_changes(hass):
+    """Source changes reach the cache without waiting for the periodic re-check."""
+    runtime_data = EVSCRuntimeData(config={}, expected_entity_count=0)
+    cache_sensor = AsyncMock()
+    runtime_data.entity_ids_by_key[HELPER_CACHED_EV_SOC_SUFFIX] = "sensor.evsc_cached_ev_soc"
+    runtime_data.entities_by_key[HELPER_CACHED_EV_SOC_SUFFIX] = cache_sensor
+    hass.states.async_set("sensor.ev_source_soc", "55")
+
+    monitor = EVSOCMonitor(
+        hass,
+        "entry-1",
+        {CONF_SOC_CAR: "sensor.ev_source_soc"},
+        runtime_data=runtime_data,
+    )
+
+    with patch(
+        "custom_components.ev_smart_charger.ev_soc_monitor.async_track_time_interval",
+        return_value=lambda: None,
+    ):
+        await monitor.async_setup()
+
+    hass.states.async_set("sensor.ev_source_soc", "61")
+    await hass.async_block_till_done()
+
+    assert monitor._last_valid_value == 61.0
+    assert cache_sensor.async_publish_cache.await_args.args[0] == 61.0
+
+    await monitor.async_remove()
+    hass.states.async_set("sensor.ev_source_soc", "70")
+    await hass.async_block_till_done()
+
+    assert monitor._last_valid_value == 61.0
+
+
 async def test_ev_soc_monitor_keeps_cache_for_invalid_source_state(hass):
     """Unavailable source values do not overwrite the cached SOC."""
     runtime_data = EVSCRuntimeData(config={}, expected_entity_count=0)
@@ -138,6 +207,27 @@ def test_astral_time_service_day_and_night_calculations(hass):
         assert service.is_nighttime(datetime(2026, 3, 6, 12, 0)) is False
 
 
+def test_astral_time_service_caches_events_per_day(hass):
+    """Repeated lookups for the same local day compute the event once."""
+    service = AstralTimeService(hass)
+
+    with patch(
+        "custom_components.ev_smart_charger.utils.astral_time_service.get_astral_event_date",
+        side_effect=_fake_astral_event,
+    ) as astral_mock:
+        first = service.get_sunrise(datetime(2026, 3, 6, 12, 0))
+        assert service.get_sunrise(datetime(2026, 3, 6, 12, 1)) == first
+        assert astral_mock.call_count == 1
+
+        service.get_sunset(datetime(2026, 3, 6, 12, 0))
+        assert astral_mock.call_count == 2
+
+        # A location change (including elevation) must not reuse cached events
+        hass.config.elevation += 100
+        service.get_sunrise(datetime(2026, 3, 6, 12, 0))
+        assert astral_mock.call_count == 3
+
+
 def test_astral_time_service_next_sunrise_and_blocking_window(hass):
     """Blocking-window calculations handle before-sunrise and night-charge cases."""
     service = AstralTimeService(hass)
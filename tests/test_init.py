@@ -190,5 +190,6 @@ async def test_async_unload_entry_cleans_up_runtime_components(hass):
     runtime_data.diagnostic_manager.async_remove.assert_awaited_once()
     runtime_data.log_manager.async_remove.assert_awaited_once()
     runtime_data.ev_soc_monitor.async_remove.assert_awaited_once()
+    runtime_data.charger_controller.async_remove.assert_awaited_once()
     unload_platforms.assert_awaited_once()
     assert entry.runtime_data is None
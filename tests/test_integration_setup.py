@@ -259,7 +259,7 @@ async def test_async_unload_entry_removes_components_in_reverse_order(hass) -> N
     runtime_data.diagnostic_manager = remover("diagnostic")
     runtime_data.log_manager = remover("log")
     runtime_data.ev_soc_monitor = remover("soc")
-    runtime_data.charger_controller = SimpleNamespace()
+    runtime_data.charger_controller = remover("charger")
     entry.runtime_data = runtime_data
 
     with patch.object(
@@ -270,7 +270,7 @@ async def test_async_unload_entry_removes_components_in_reverse_order(hass) -> N
         result = await async_unload_entry(hass, entry)
 
     assert result is True
-    assert call_order == ["solar", "blocker", "boost", "night", "priority", "diagnostic", "log", "soc"]
+    assert call_order == ["solar", "blocker", "boost", "night", "priority", "diagnostic", "log", "soc", "charger"]
     assert entry.runtime_data is None
 
 
@@ -4,10 +4,16 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.ev_smart_charger.const import HELPER_ENABLE_FILE_LOGGING_SUFFIX
+from custom_components.ev_smart_charger.const import (
+    HELPER_ENABLE_FILE_LOGGING_SUFFIX,
+    LOG_TOGGLE_DEBOUNCE,
+)
 from custom_components.ev_smart_charger.log_manager import LogManager
 from custom_components.ev_smart_charger.runtime import EVSCRuntimeData
 from custom_components.ev_smart_charger.utils.logging_helper import EVSCLogger
@@ -82,7 +88,8 @@ async def test_log_manager_midnight_rotation_keeps_single_handler(hass):
 
     tomorrow = datetime.now() + timedelta(days=1)
     midnight_tomorrow = datetime(tomorrow.year, tomorrow.month, tomorrow.day, 0, 0, 0)
-    await manager._handle_midnight(midnight_tomorrow)
+    manager._handle_midnight(midnight_tomorrow)
+    await hass.async_block_till_done()
 
     new_path = EVSCLogger.get_global_log_file_path()
     assert new_path is not None
@@ -110,6 +117,31 @@ async def test_log_manager_toggle_off_disables_global_handler(hass):
     await manager.async_remove()
 
 
+async def test_log_manager_follows_toggle_state_changes(hass):
+    """A toggle state change is applied through the state listener."""
+    toggle_entity = f"switch.test_{HELPER_ENABLE_FILE_LOGGING_SUFFIX}"
+    hass.states.async_set(toggle_entity, "on")
+
+    manager = LogManager(hass, "test_entry")
+    await manager.async_setup([EVSCLogger("A")])
+    assert EVSCLogger.is_global_file_logging_enabled() is True
+
+    # Rapid flips settle on the last state, applied after the debounce window
+    hass.states.async_set(toggle_entity, "off")
+    hass.states.async_set(toggle_entity, "on")
+    hass.states.async_set(toggle_entity, "off")
+    await hass.async_block_till_done()
+    assert EVSCLogger.is_global_file_logging_enabled() is True
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=LOG_TOGGLE_DEBOUNCE + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert EVSCLogger.is_global_file_logging_enabled() is False
+    await manager.async_remove()
+
+
 async def test_log_manager_captures_package_child_loggers(hass):
     """Coordinator/package child loggers must be written by the shared file handler."""
     toggle_entity = f"switch.test_{HELPER_ENABLE_FILE_LOGGING_SUFFIX}"
@@ -140,3 +172,33 @@ async def test_log_manager_does_not_scan_global_state_when_runtime_data_exists(h
 
     assert manager._toggle_entity is None
     assert EVSCLogger.is_global_file_logging_enabled() is False
+
+
+async def test_file_handler_buffers_until_flush_except_warnings(hass, tmp_path):
+    """INFO records wait for a flush; WARNING and above are written immediately."""
+    log_path = tmp_path / "evsc.log"
+    EVSCLogger.enable_global_file_logging(str(log_path))
+    logger = logging.getLogger("custom_components.ev_smart_charger.buffer_test")
+    logger.setLevel(logging.INFO)
+
+    info_marker = f"BUFFERED_INFO_{datetime.now().timestamp()}"
+    logger.info(info_marker)
+    assert info_marker not in log_path.read_text(encoding="utf-8")
+
+    warning_marker = f"IMMEDIATE_WARNING_{datetime.now().timestamp()}"
+    logger.warning(warning_marker)
+    contents = log_path.read_text(encoding="utf-8")
+    assert info_marker in contents
+    assert warning_marker in contents
+
+    late_marker = f"FLUSHED_INFO_{datetime.now().timestamp()}"
+    logger.info(late_marker)
+    manager = LogManager(hass, "test_entry")
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as executor_mock:
+        await manager._async_flush_file_log()
+
+    executor_mock.assert_called_once_with(EVSCLogger.flush_global_file_logging)
+    assert manager._flush_job is None
+    assert late_marker in log_path.read_text(encoding="utf-8")
@@ -1134,6 +1134,29 @@ async def test_disabled_switch_does_not_mutate_session_state(hass, night_charge)
     assert night_charge._session_state == "ready"
 
 
+async def test_idle_periodic_check_skips_window_until_next_schedule(hass, night_charge):
+    """Outside the window, ticks skip the window check until shortly before
+    the next scheduled start; a schedule change drops the skip."""
+    noon = dt_util.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    now_path = "custom_components.ev_smart_charger.night_smart_charge.dt_util.now"
+
+    with patch(now_path, return_value=noon):
+        await night_charge._async_periodic_check(noon)
+
+    # Fixture schedule is 01:00 → next window opens tomorrow (grace 2 min, wake 30 min)
+    tomorrow = noon + timedelta(days=1)
+    assert night_charge._idle_until == tomorrow.replace(hour=0, minute=28)
+
+    night_charge._is_in_active_window = AsyncMock(return_value=False)
+    with patch(now_path, return_value=noon + timedelta(minutes=1)):
+        await night_charge._async_periodic_check(noon + timedelta(minutes=1))
+    night_charge._is_in_active_window.assert_not_called()
+
+    hass.states.async_set("input_datetime.test_evsc_night_charge_time", "23:00:00")
+    await hass.async_block_till_done()
+    assert night_charge._idle_until is None
+
+
 # ============================================================================
 # v2.9.0 — grid-monitor lifecycle check: tolerant blocklist (non-Tuya wallboxes)
 # ============================================================================
@@ -1433,11 +1456,34 @@ async def test_late_arrival_ignores_connected_to_connected_transition(
         "old_state": MagicMock(state="charging"),
         "new_state": MagicMock(state="charged"),
     }
-    await night_charge._async_charger_status_changed(event)
+    night_charge._charger_status_changed(event)
+    await hass.async_block_till_done()
 
     night_charge._evaluate_and_charge.assert_not_awaited()
 
 
+async def test_charger_status_listener_schedules_only_plug_in_events(hass, night_charge):
+    """The synchronous listener drops non-transitions without scheduling work."""
+    night_charge._async_charger_status_changed = AsyncMock()
+
+    event = MagicMock()
+    event.data = {
+        "old_state": MagicMock(state="charging"),
+        "new_state": MagicMock(state="charging"),
+    }
+    night_charge._charger_status_changed(event)
+    await hass.async_block_till_done()
+    night_charge._async_charger_status_changed.assert_not_awaited()
+
+    event.data = {
+        "old_state": MagicMock(state="available"),
+        "new_state": MagicMock(state="charging"),
+    }
+    night_charge._charger_status_changed(event)
+    await hass.async_block_till_done()
+    night_charge._async_charger_status_changed.assert_awaited_once_with(event)
+
+
 # ============================================================================
 # v2.9.2: Armed-window-without-session disarm (2026-07-21 incident)
 # ============================================================================